@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 성능 벤치마크 (네트워크 불필요)
+---------------------------------
+대상
+- ai_guess_vehicle_types : 입력 길이 × 사전(KEYWORD_RULES/MODEL_LEXICON) 크기
+- 내장 차종(VEHICLES) 조회 : dict 직접 조회, 검색 인덱스, 판정 테이블, 자동완성 트라이
+- calc_elapsed / 감가상각 (건별·일괄), 소득세 (건별·일괄)
+- classify_vehicle_external / classify_vehicles_batched : 로컬 스텁(openai_stub) 대상
+
+입력은 모두 시드 고정 합성 데이터, 결과는 JSON.
+
+실행 예:
+  python bench.py run -o base.json            # 전체
+  python bench.py run --quick -o new.json     # 작은 입력으로 빠르게
+  python bench.py compare base.json new.json --threshold 0.10   # 10% 이상 느려진 항목 표시 (있으면 종료코드 1)
+  (base 에만 있는 항목도 회귀로 처리, new 에만 있는 항목은 목록으로 표시)
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import vehicle_rules
+from decision_table import build_decision_table, make_key
+from openai_stub import StubClient
+from vehicle_catalog import VEHICLES
+from vehicle_external import classify_vehicle_external, classify_vehicles_batched
+from vehicle_search import build_vehicle_search_index
+from vehicle_trie import build_vehicle_trie
+from won_math import (DEPRECIATION_RATE_BP, calc_elapsed, depreciation_batch, depreciation_schedule_won,
+                      income_tax_batch, income_tax_won)
+
+DEFAULT_SEED = 20251019
+MIN_TIME_S = 0.2   # 1회 측정당 최소 소요시간 (반복 횟수 자동 조정)
+REPEAT = 5
+
+# (이름, 매개변수, 1회 호출 함수, 1회 호출당 처리 건수)
+Case = Tuple[str, Dict[str, Any], Callable[[], Any], int]
+
+
+# ---------------------------------------------
+# 측정
+# ---------------------------------------------
+def measure(fn: Callable[[], Any], min_time: float = MIN_TIME_S, repeat: int = REPEAT) -> Dict[str, float]:
+    """timeit 방식: min_time 을 넘도록 반복 횟수를 정한 뒤 repeat 번 측정해 1회당 시간을 구함."""
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - t0 >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return {"best_s": min(samples), "median_s": statistics.median(samples), "number": number}
+
+
+# ---------------------------------------------
+# 합성 입력
+# ---------------------------------------------
+def random_hangul(rng: random.Random, n: int) -> str:
+    return "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(n))
+
+
+def vehicle_text(rng: random.Random, length: int) -> str:
+    """알려진 키워드 몇 개와 임의 음절을 섞어 길이 length 의 차량 문자열 생성."""
+    words = list(vehicle_rules.KEYWORD_RULES) + ["9인승", "11인승", "화물", "탑차"]
+    parts: List[str] = []
+    while sum(len(p) + 1 for p in parts) < length:
+        parts.append(rng.choice(words) if rng.random() < 0.3 else random_hangul(rng, rng.randint(2, 5)))
+    return " ".join(parts)[:length]
+
+
+@contextmanager
+def lexicon_size(rng: random.Random, size: int) -> Iterator[None]:
+    """KEYWORD_RULES / MODEL_LEXICON 을 합성 항목으로 size 개까지 늘렸다가 원래대로 되돌림."""
+    keywords, lexicon = vehicle_rules.KEYWORD_RULES, vehicle_rules.MODEL_LEXICON
+    tags = vehicle_rules.VEHICLE_TAGS_ORDER
+    big_keywords = dict(keywords)
+    big_lexicon = dict(lexicon)
+    while len(big_keywords) < size:
+        big_keywords[random_hangul(rng, rng.randint(2, 4))] = (rng.choice(tags), rng.randint(1, 6))
+    while len(big_lexicon) < size:
+        big_lexicon[random_hangul(rng, rng.randint(2, 4))] = rng.choice(tags)
+    vehicle_rules.KEYWORD_RULES, vehicle_rules.MODEL_LEXICON = big_keywords, big_lexicon
+    try:
+        yield
+    finally:
+        vehicle_rules.KEYWORD_RULES, vehicle_rules.MODEL_LEXICON = keywords, lexicon
+
+
+# ---------------------------------------------
+# 벤치마크 항목
+# ---------------------------------------------
+def guess_cases(rng: random.Random, quick: bool) -> List[Tuple[str, Dict[str, Any], Callable[[], Any], int, int]]:
+    """(이름, 매개변수, 함수, 건수, 사전 크기). 사전 크기는 측정 시점에 적용."""
+    lengths = [8, 64] if quick else [8, 64, 512]
+    sizes = [0, 1000] if quick else [0, 1000, 10000]
+    cases = []
+    for size in sizes:
+        for length in lengths:
+            texts = [vehicle_text(rng, length) for _ in range(50)]
+            cycle = iter(range(1 << 62))
+
+            def fn(texts=texts, cycle=cycle):
+                return vehicle_rules.ai_guess_vehicle_types(texts[next(cycle) % len(texts)])
+
+            cases.append((f"ai_guess_vehicle_types[len={length},lexicon={size or 'builtin'}]",
+                          {"input_len": length, "lexicon": size or "builtin"}, fn, 1, size))
+    return cases
+
+
+def catalog_cases(rng: random.Random, quick: bool) -> List[Case]:
+    pairs = [(c, m) for c, models in VEHICLES.items() for m in models]
+    sample = [rng.choice(pairs) for _ in range(10_000)]
+    index = build_vehicle_search_index()
+    trie = build_vehicle_trie()
+    table = build_decision_table()
+    queries = [m[:rng.randint(1, 3)] for _, m in sample[:200]]
+    keys = [make_key(rng.choice(["음식점", "택시", "도소매", "카페"]), m) for _, m in sample]
+
+    def dict_lookup():
+        for c, m in sample:
+            VEHICLES[c][m]
+
+    cycle = iter(range(1 << 62))
+    return [
+        ("VEHICLES[company][model]", {"n": len(sample)}, dict_lookup, len(sample)),
+        ("vehicle_search.search", {"queries": len(queries)},
+         lambda: index.search(queries[next(cycle) % len(queries)]), 1),
+        ("vehicle_trie.complete", {"queries": len(queries)},
+         lambda: trie.complete(queries[next(cycle) % len(queries)]), 1),
+        ("decision_table.lookup_many", {"n": len(keys)}, lambda: table.lookup_many(keys), len(keys)),
+    ]
+
+
+def won_cases(rng: random.Random, quick: bool) -> List[Case]:
+    n = 10_000 if quick else 100_000
+    nrng = np.random.default_rng(rng.randrange(1 << 32))
+    incomes = nrng.integers(0, 300_000_000, n, dtype=np.int64)
+    prices = nrng.integers(0, 2_000_000_000, n, dtype=np.int64)
+    rates = np.where(nrng.random(n) < 0.5, DEPRECIATION_RATE_BP["building"], DEPRECIATION_RATE_BP["other"])
+    elapsed = nrng.integers(1, 30, n, dtype=np.int64)
+    periods = [(rng.randrange(4000, 4100), rng.randrange(0, 40)) for _ in range(1000)]
+    incomes_list = incomes[:1000].tolist()
+
+    def elapsed_loop():
+        for p, d in periods:
+            calc_elapsed(p, p + d)
+
+    def income_loop():
+        for x in incomes_list:
+            income_tax_won(x)
+
+    return [
+        ("calc_elapsed", {"n": len(periods)}, elapsed_loop, len(periods)),
+        ("depreciation_schedule_won[elapsed=20]", {"elapsed": 20},
+         lambda: depreciation_schedule_won(123_456_789, DEPRECIATION_RATE_BP["building"], 20), 1),
+        ("depreciation_batch", {"n": n}, lambda: depreciation_batch(prices, rates, elapsed), n),
+        ("income_tax_won", {"n": len(incomes_list)}, income_loop, len(incomes_list)),
+        ("income_tax_batch", {"n": n}, lambda: income_tax_batch(incomes), n),
+    ]
+
+
+def external_cases(rng: random.Random, quick: bool) -> List[Case]:
+    texts = [vehicle_text(rng, 16) for _ in range(100)]
+    client = StubClient(seed=rng.randrange(1 << 32))  # 지연 없음 → 클라이언트 측 오버헤드만 측정
+    cycle = iter(range(1 << 62))
+    return [
+        ("classify_vehicle_external[stub]", {"stub_latency_ms": 0},
+         lambda: classify_vehicle_external(texts[next(cycle) % len(texts)], client), 1),
+        ("classify_vehicles_batched[stub,batch=20]", {"n": len(texts), "batch_size": 20},
+         lambda: classify_vehicles_batched(texts, client, batch_size=20), len(texts)),
+    ]
+
+
+# ---------------------------------------------
+# 실행 / 비교
+# ---------------------------------------------
+def run(seed: int, quick: bool, only: Optional[str]) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    min_time = MIN_TIME_S / 4 if quick else MIN_TIME_S
+    results: Dict[str, Any] = {}
+
+    def record(name: str, params: Dict[str, Any], fn: Callable[[], Any], items: int):
+        if only and only not in name:
+            return
+        m = measure(fn, min_time=min_time)
+        results[name] = {"params": params, "items": items, **m, "per_item_s": m["median_s"] / items}
+        print(f"{name:<55} {m['median_s'] * 1e6:12.2f} us/op  {m['median_s'] / items * 1e9:12.1f} ns/item",
+              file=sys.stderr)
+
+    for name, params, fn, items, size in guess_cases(rng, quick):
+        with lexicon_size(random.Random(seed + size), size):
+            record(name, params, fn, items)
+    for case in catalog_cases(rng, quick) + won_cases(rng, quick) + external_cases(rng, quick):
+        record(*case)
+
+    return {
+        "meta": {
+            "seed": seed,
+            "quick": quick,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[str]:
+    """threshold(비율) 이상 느려졌거나 새 결과에서 사라진 항목 이름 목록. 표는 표준출력으로.
+    새 결과에만 있는 항목은 목록으로만 알림.
+    """
+    regressions = []
+    print(f"{'benchmark':<55}{'base us':>12}{'new us':>12}{'change':>10}")
+    for name, b in base["results"].items():
+        n = new["results"].get(name)
+        if n is None:
+            # 이름이 바뀌었거나 삭제된 항목도 비교 누락으로 보고 회귀 처리
+            regressions.append(name)
+            print(f"{name:<55}{b['median_s'] * 1e6:12.2f}{'—':>12}{'—':>10}  ← 새 결과에 없음")
+            continue
+        if b["median_s"] > 0:
+            ratio = n["median_s"] / b["median_s"] - 1.0
+        else:
+            ratio = 0.0 if n["median_s"] <= 0 else float("inf")
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = "  ← 회귀"
+        print(f"{name:<55}{b['median_s'] * 1e6:12.2f}{n['median_s'] * 1e6:12.2f}{ratio:>+10.1%}{flag}")
+    for name, n in new["results"].items():
+        if name not in base["results"]:
+            print(f"{name:<55}{'—':>12}{n['median_s'] * 1e6:12.2f}{'—':>10}  (새 항목)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="로컬 성능 벤치마크")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("run", help="벤치마크 실행 후 JSON 출력")
+    r.add_argument("-o", "--output", help="결과 JSON 파일 (기본: 표준출력)")
+    r.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    r.add_argument("--quick", action="store_true", help="작은 입력·짧은 측정")
+    r.add_argument("--only", help="이름에 이 문자열이 들어간 항목만 실행")
+    c = sub.add_parser("compare", help="두 결과 JSON 비교")
+    c.add_argument("base")
+    c.add_argument("new")
+    c.add_argument("--threshold", type=float, default=0.10, help="회귀로 볼 중앙값 증가 비율 (기본 0.10)")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "run":
+        data = json.dumps(run(args.seed, args.quick, args.only), ensure_ascii=False, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(data + "\n")
+        else:
+            print(data)
+        return 0
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    regressions = compare(base, new, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)}개 항목이 {args.threshold:.0%} 이상 느려졌거나 새 결과에 없습니다.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+차량 목록 일괄 분류 CLI (ai_guess_vehicle_types 와 동일 규칙)
+---------------------------------
+- CSV/JSONL 입력을 청크 단위로 스트리밍하며 ProcessPoolExecutor 로 분산 처리
+- 분류와 출력 직렬화는 워커에서, 메인 프로세스는 읽기·쓰기만 담당
+- 동시에 처리 중인 청크 수를 제한하고 입력 순서대로 바로 출력 → 입력 크기와 무관한 메모리 사용
+- 출력 열: tags, scores, seats, 공제
+- 차량명/업종 열이 입력에 없거나 JSONL 줄이 객체가 아니면 바로 오류로 종료 (종료코드 2)
+
+실행 예:
+  python classify_batch.py fleet.csv -o result.csv --column 차량명
+  python classify_batch.py fleet.jsonl --column vehicle --industry-column industry --workers 8
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+from industry_index import is_deductible_industry
+from vehicle_rules import ai_guess_vehicle_types, deduction_from_guess, deduction_label
+
+OUTPUT_FIELDS = ["tags", "scores", "seats", "공제"]
+
+
+# ---------------------------------------------
+# 분류 (워커 프로세스에서 실행)
+# ---------------------------------------------
+def classify_one(vehicle: str, industry: str = "") -> Dict[str, Any]:
+    tags, scores, seats = ai_guess_vehicle_types(vehicle)
+    if industry and is_deductible_industry(industry):
+        deductible: Optional[bool] = True
+    else:
+        deductible = deduction_from_guess(vehicle, tags, seats)
+    return {"tags": tags, "scores": scores, "seats": seats, "공제": deduction_label(deductible)}
+
+
+def classify_chunk(rows: List[Dict[str, Any]], fmt: str, fieldnames: List[str], column: str,
+                   industry_column: Optional[str]) -> str:
+    """행 목록을 분류하고 출력 형식으로 직렬화한 텍스트를 반환 (직렬화도 워커에서 처리)."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=fieldnames) if fmt == "csv" else None
+    for row in rows:
+        industry = str(row.get(industry_column) or "") if industry_column else ""
+        result = classify_one(str(row.get(column) or ""), industry)
+        if writer is None:
+            buf.write(json.dumps({**row, **result}, ensure_ascii=False) + "\n")
+        else:
+            writer.writerow({
+                **row,
+                "tags": ";".join(result["tags"]),
+                "scores": json.dumps(result["scores"], ensure_ascii=False),
+                "seats": result["seats"],
+                "공제": result["공제"],
+            })
+    return buf.getvalue()
+
+
+# ---------------------------------------------
+# 입출력
+# ---------------------------------------------
+def detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def read_rows(f, fmt: str) -> Iterator[Dict[str, Any]]:
+    """CSV 행 / JSONL 객체. JSONL 줄이 JSON 객체가 아니면 줄 번호와 함께 ValueError."""
+    if fmt == "csv":
+        yield from csv.DictReader(f)
+    else:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{lineno}번째 줄: JSON 형식 오류 ({e.msg})") from None
+            if not isinstance(row, dict):
+                raise ValueError(f"{lineno}번째 줄: JSON 객체가 아닙니다 ({type(row).__name__})")
+            yield row
+
+
+def check_columns(chunk: List[Dict[str, Any]], column: str, industry_column: Optional[str]):
+    """첫 청크에 차량명/업종 열이 하나도 없으면 ValueError (모든 행이 빈 문자열로 분류되는 것을 방지)."""
+    present = {k for row in chunk for k in row if k is not None}
+    missing = [c for c in (column, industry_column) if c and c not in present]
+    if missing:
+        raise ValueError(f"입력에 없는 열: {', '.join(missing)} (입력 열: {', '.join(sorted(present)) or '없음'})")
+
+
+def chunked(it: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(rows: Iterator[Dict[str, Any]], out, fmt: str, column: str, industry_column: Optional[str],
+        workers: int, chunk_size: int) -> int:
+    """청크를 워커에 분배하고 입력 순서대로 기록. 처리한 행 수 반환."""
+    total = 0
+    max_in_flight = workers * 2  # 워커가 놀지 않을 만큼만 미리 제출
+    pending: deque = deque()
+
+    def drain_one():
+        nonlocal total
+        n, fut = pending.popleft()
+        out.write(fut.result())
+        total += n
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        fieldnames: List[str] = []
+        for i, chunk in enumerate(chunked(rows, chunk_size)):
+            if i == 0:
+                check_columns(chunk, column, industry_column)
+            if fmt == "csv" and not fieldnames:
+                # CSV 는 첫 행의 열 + 분류 결과 열로 머리글을 한 번만 기록
+                fieldnames = list(chunk[0]) + OUTPUT_FIELDS
+                csv.DictWriter(out, fieldnames=fieldnames).writeheader()
+            pending.append((len(chunk), pool.submit(classify_chunk, chunk, fmt, fieldnames, column, industry_column)))
+            if len(pending) >= max_in_flight:
+                drain_one()
+        while pending:
+            drain_one()
+    return total
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="차량 목록을 ai_guess_vehicle_types 규칙으로 일괄 분류")
+    ap.add_argument("input", help="입력 파일 (CSV 또는 JSONL)")
+    ap.add_argument("-o", "--output", help="출력 파일 (기본: 표준출력)")
+    ap.add_argument("--format", choices=["csv", "jsonl"], help="입력/출력 형식 (기본: 확장자로 판단)")
+    ap.add_argument("--column", default="vehicle", help="차량명 열/필드 이름 (기본: vehicle)")
+    ap.add_argument("--industry-column", help="업종 열/필드 이름 (지정 시 공제 업종이면 공제가능)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    ap.add_argument("--chunk-size", type=int, default=2000, help="워커에 한 번에 보내는 행 수")
+    args = ap.parse_args(argv)
+
+    fmt = detect_format(args.input, args.format)
+    start = time.perf_counter()
+    try:
+        with open(args.input, encoding="utf-8-sig", newline="") as fin, \
+                (open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout) as fout:
+            total = run(read_rows(fin, fmt), fout, fmt, args.column, args.industry_column,
+                        max(1, args.workers), max(1, args.chunk_size))
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+    print(f"{total:,}건 처리, {elapsed:.2f}s ({total / elapsed if elapsed else 0:,.0f}건/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+업종 × 차종 공제여부 사전 계산 테이블
+---------------------------------
+- 판정은 업종의 공제 분류(industry_index: 1=일반, 2=차량 직접 사용)와 차종으로 정해지므로
+  내장 차종(VEHICLES) × 공제 분류 전 조합을 미리 계산해 dict(해시맵)에 담아 둠
+- lookup_many() : 키 목록을 한 번에 조회 (미리 만든 키 100만 건 기준 1초 미만)
+  키 생성(업종 해석 + 차종 정규화)이 조회보다 훨씬 비싸므로 대량 조회는 make_keys() 로 키를 만들 것
+  (서로 다른 업종·차종 문자열마다 한 번씩만 계산)
+- 업종 분류 2 키는 차종과 무관하게 바로 공제 판정 (규칙 판정·캐시 사용 안 함)
+- 테이블에 없는 키만 기존 규칙(ai_guess_vehicle_types)으로 판정하고 캐시 (최대 LIVE_CACHE_SIZE 개)
+  규칙 판정에는 정규화 키가 아니라 원래 차종 문자열을 넘겨 실시간 분류와 같은 결과를 냄
+
+실행: python decision_table.py  (테이블 생성 후 100만 건 조회 시간 출력)
+"""
+
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from industry_index import industry_class
+from vehicle_catalog import VEHICLES
+from vehicle_rules import ai_guess_vehicle_types, deduction_from_guess
+from vehicle_search import normalize_text
+
+KEY_SEP = "|"
+INDUSTRY_CLASSES = (1, 2)
+LIVE_CACHE_SIZE = 4096
+
+
+class Verdict(NamedTuple):
+    deductible: Optional[bool]  # True=공제가능, False=공제불가, None=좌석수 확인 필요
+    reason: str
+    source: str                 # "table" | "live"
+
+
+# 업종 분류 2(택시·자동차임대 등)는 차종과 무관하게 이 판정 객체를 공유
+INDUSTRY_VERDICT = Verdict(True, "업종(차량 직접 사용)", "table")
+
+
+def make_key(industry: str, vehicle: str) -> str:
+    """업종/차량 문자열 → '공제분류|정규화 차종' 키. lookup_many 에 넘기는 키는 이 함수로 만든다."""
+    return str(industry_class(industry)) + KEY_SEP + normalize_text(vehicle)
+
+
+def make_keys(industries: Iterable[str], vehicles: Iterable[str]) -> List[str]:
+    """make_key 의 일괄판. 같은 업종·차종 문자열은 한 번만 해석/정규화한다."""
+    prefixes: Dict[str, str] = {}
+    norms: Dict[str, str] = {}
+    keys: List[str] = []
+    for industry, vehicle in zip(industries, vehicles):
+        prefix = prefixes.get(industry)
+        if prefix is None:
+            prefix = prefixes[industry] = str(industry_class(industry)) + KEY_SEP
+        norm = norms.get(vehicle)
+        if norm is None:
+            norm = norms[vehicle] = normalize_text(vehicle)
+        keys.append(prefix + norm)
+    return keys
+
+
+class DecisionTable:
+    """정규화 키 → Verdict 테이블. 모르는 키는 규칙 기반 판정으로 보충."""
+
+    def __init__(self, table: Dict[str, Verdict]):
+        self.table = table
+        self._live_cache: Dict[str, Verdict] = {}
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def lookup(self, industry: str, vehicle: str) -> Verdict:
+        return self.lookup_many([make_key(industry, vehicle)], [vehicle])[0]
+
+    def lookup_many(self, keys: Iterable[str], vehicles: Optional[Sequence[str]] = None) -> List[Verdict]:
+        """make_key/make_keys 로 만든 키 목록 → 같은 순서의 Verdict 목록.
+        vehicles: 키와 같은 순서의 원래 차종 문자열 (테이블에 없는 키의 규칙 판정에 사용,
+        생략하면 정규화된 차종 문자열로 판정)
+        """
+        if not isinstance(keys, (list, tuple)):
+            keys = list(keys)
+        get = self.table.get
+        results = [get(k) for k in keys]
+        if None in results:
+            industry_prefix = str(INDUSTRY_CLASSES[-1]) + KEY_SEP
+            for i, v in enumerate(results):
+                if v is None:
+                    if keys[i].startswith(industry_prefix):
+                        results[i] = INDUSTRY_VERDICT  # 내장 차종이 아니어도 업종으로 공제
+                    else:
+                        results[i] = self._live(keys[i], vehicles[i] if vehicles is not None else None)
+        return results
+
+    def _live(self, key: str, vehicle: Optional[str] = None) -> Verdict:
+        cls, _, norm = key.partition(KEY_SEP)
+        if vehicle is None:
+            vehicle = norm
+        cache_key = cls + KEY_SEP + vehicle
+        cached = self._live_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        tags, _scores, seats = ai_guess_vehicle_types(vehicle)
+        deductible = deduction_from_guess(vehicle, tags, seats)
+        reason = ", ".join(tags) if tags else "유형 미상"
+        verdict = Verdict(deductible, reason, "live")
+        if len(self._live_cache) >= LIVE_CACHE_SIZE:
+            self._live_cache.clear()
+        self._live_cache[cache_key] = verdict
+        return verdict
+
+
+def build_decision_table() -> DecisionTable:
+    """공제 분류 × VEHICLES 전 조합을 미리 판정.
+    차종 키는 '차종명'과 '회사명+차종명' 두 가지로 등록한다.
+    """
+    # 차종별 판정은 업종과 무관하므로 한 번만 만들어 공유
+    vehicle_verdicts: Dict[str, Verdict] = {}
+    for company, models in VEHICLES.items():
+        for model, info in models.items():
+            v = Verdict(info.get("공제여부") == "공제가능합니다.", info.get("설명", ""), "table")
+            vehicle_verdicts[normalize_text(model)] = v
+            vehicle_verdicts[normalize_text(company + model)] = v
+
+    table: Dict[str, Verdict] = {}
+    for cls in INDUSTRY_CLASSES:
+        prefix = str(cls) + KEY_SEP
+        for vkey, v in vehicle_verdicts.items():
+            table[prefix + vkey] = INDUSTRY_VERDICT if cls == 2 else v
+    return DecisionTable(table)
+
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    dt = build_decision_table()
+    print(f"테이블 생성: {len(dt):,}개 키, {time.perf_counter() - t0:.3f}s")
+
+    pairs = [(industry, model) for industry in ("음식점", "택시", "도소매업") for models in VEHICLES.values()
+             for model in models]
+    industries = [pairs[i % len(pairs)][0] for i in range(1_000_000)]
+    vehicles = [pairs[i % len(pairs)][1] for i in range(1_000_000)]
+    t0 = time.perf_counter()
+    keys = make_keys(industries, vehicles)
+    print(f"make_keys 100만 건: {time.perf_counter() - t0:.3f}s")
+    t0 = time.perf_counter()
+    dt.lookup_many(keys, vehicles)
+    print(f"lookup_many 100만 건: {time.perf_counter() - t0:.3f}s")
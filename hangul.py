@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+한글 자모 유틸리티
+---------------------------------
+- 완성형 음절(가~힣)을 초성/중성/종성 자모로 분해
+- 겹모음·겹받침은 키보드 입력 순서대로 낱자모로 풀어서 비교
+  (예: 입력 중간 상태 '슽' → ㅅㅡㅌ 은 '스타' → ㅅㅡㅌㅏ 의 접두어)
+- 초성 추출 ('스타렉스' → 'ㅅㅌㄹㅅ') 및 초성 검색어 판별
+"""
+
+from typing import List
+
+# ---------------------------------------------
+# 자모 표 (호환용 자모, U+3131~)
+# ---------------------------------------------
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+            "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 겹모음/겹받침 → 입력 순서의 낱자모 (쌍자음 ㄲ·ㄸ 등은 한 번에 입력되므로 그대로 둠)
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+
+def is_syllable(ch: str) -> bool:
+    """완성형 한글 음절 여부."""
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def decompose(ch: str) -> List[str]:
+    """음절 1자를 [초성, 중성, 종성] 으로 분해 (종성이 없으면 2개). 한글이 아니면 [ch]."""
+    if not is_syllable(ch):
+        return [ch]
+    code = ord(ch) - HANGUL_BASE
+    cho, rest = divmod(code, 21 * 28)
+    jung, jong = divmod(rest, 28)
+    parts = [CHOSUNG[cho], JUNGSUNG[jung]]
+    if jong:
+        parts.append(JONGSUNG[jong])
+    return parts
+
+
+def to_jamo(text: str) -> str:
+    """문자열을 낱자모 시퀀스로 변환. 한글 외 문자는 그대로 둔다."""
+    out = []
+    for ch in text:
+        for j in decompose(ch):
+            out.append(COMPOUND_JAMO.get(j, j))
+    return "".join(out)
+
+
+def chosung(text: str) -> str:
+    """음절을 초성으로 치환 (예: '스타렉스' → 'ㅅㅌㄹㅅ'). 한글 외 문자는 그대로 둔다."""
+    return "".join(CHOSUNG[(ord(ch) - HANGUL_BASE) // (21 * 28)] if is_syllable(ch) else ch for ch in text)
+
+
+def is_chosung_query(text: str) -> bool:
+    """초성 자음(ㄱ~ㅎ)으로만 이루어진 입력인지 여부 (예: 'ㅅㅌㄹ')."""
+    return bool(text) and all(ch in CHOSUNG for ch in text)
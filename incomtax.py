@@ -1,17 +1,12 @@
+from won_math import income_level, income_tax_won
+
 # 소득(income)과 세금(tax) 변수 선언
 income = 55000000  # 연소득 (단위: 원)
 tax = 0  # 세금 초기값
 
-# 소득 수준 분류 및 세금 계산
-if income >= 100000000:
-    level = "고소득자"
-    tax = income * 0.3  # 세율 30%
-elif income >= 50000000:
-    level = "중간소득자"
-    tax = income * 0.2  # 세율 20%
-else:
-    level = "저소득자"
-    tax = income * 0.1  # 세율 10%
+# 소득 수준 분류 및 세금 계산 (원 단위 정수, 세율 30%/20%/10% – won_math.INCOME_TAX_BRACKETS)
+level, _ = income_level(income)
+tax = income_tax_won(income)
 
 # 결과 출력
 print(f"소득 수준: {level}")
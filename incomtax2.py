@@ -1,21 +1,16 @@
 import streamlit as st
 
+from won_math import income_level, income_tax_won
+
 # 제목
 st.title("💰 소득에 따른 세금 계산기")
 
 # 사용자 입력 (연소득)
 income = st.number_input("연소득을 입력하세요 (원)", min_value=0, value=55000000, step=1000000)
 
-# 세금 계산
-if income >= 100000000:
-    level = "고소득자"
-    tax = income * 0.3  # 세율 30%
-elif income >= 50000000:
-    level = "중간소득자"
-    tax = income * 0.2  # 세율 20%
-else:
-    level = "저소득자"
-    tax = income * 0.1  # 세율 10%
+# 세금 계산 (원 단위 정수, 세율 30%/20%/10% – won_math.INCOME_TAX_BRACKETS)
+level, _ = income_level(int(income))
+tax = income_tax_won(int(income))
 
 # 결과 출력
 st.subheader("📊 계산 결과")
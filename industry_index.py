@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+업종 코드 색인 (모든 챗봇/도구 공용)
+---------------------------------
+- 자유 입력 업종 문자열 → 표준산업분류 코드 + 공제 분류(1=일반, 2=차량 직접 사용 업종)
+- 정규화: 소문자화, 공백·기호 제거 ('농, 임 어업' == '농임어업')
+- 업종마다 여러 동의어를 등록하고 Aho-Corasick 다중 패턴 매칭으로 한 번에 검색
+- 판정 우선순위: 공제 분류 2 가 하나라도 있으면 우선(기존 부분일치 규칙과 동일), 그다음 긴 동의어
+
+내장 표는 챗봇에서 쓰는 업종 위주의 대표 코드만 담고 있으며,
+전체 표준산업분류는 load_industry_csv() 로 CSV(code,name,class,synonyms)를 읽어 추가합니다.
+(환경변수 INDUSTRY_CODES_CSV 를 지정하면 공용 색인에 자동으로 포함)
+"""
+
+import csv
+import os
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# ---------------------------------------------
+# 내장 업종 표: (코드, 명칭, 공제 분류, 동의어)
+# ---------------------------------------------
+BUILTIN_INDUSTRIES: List[Tuple[str, str, int, List[str]]] = [
+    # 차량을 직접 사용하는 업종 → 공제
+    ("49231", "택시 운송업", 2, ["택시", "개인택시", "법인택시", "택시운송"]),
+    ("85661", "운전학원", 2, ["자동차학원", "운전학원", "자동차운전학원"]),
+    ("76110", "자동차 임대업", 2, ["자동차임대업", "자동차임대", "렌터카", "렌트카", "카셰어링"]),
+    # 일반 업종
+    ("A", "농업, 임업 및 어업", 1, ["농업", "임업", "어업", "농임어업", "영농", "축산"]),
+    ("C", "제조업", 1, ["제조업", "제조", "공장"]),
+    ("F", "건설업", 1, ["건설업", "건축업", "건설", "건축", "인테리어"]),
+    ("G", "도매 및 소매업", 1, ["도소매", "도매업", "소매업", "도매", "소매", "쇼핑몰", "편의점"]),
+    ("H", "운수 및 창고업", 1, ["운수업", "운송업", "운수", "물류", "택배", "창고업"]),
+    ("55", "숙박업", 1, ["숙박업", "숙박", "호텔", "모텔", "펜션"]),
+    ("56", "음식점 및 주점업", 1, ["음식점", "식당", "음식업", "요식업", "주점", "카페", "커피전문점", "제과점"]),
+    ("6811", "부동산 임대업", 1, ["부동산임대업", "부동산임대", "임대업"]),
+    ("S", "수리 및 기타 개인 서비스업", 1, ["서비스업", "서비스", "미용실", "세탁소", "수리업"]),
+]
+
+
+RESOLVE_CACHE_SIZE = 4096
+
+
+class IndustryCode(NamedTuple):
+    code: str
+    name: str
+    deduction_class: int  # 1=일반(차종에 따라 판단), 2=차량 직접 사용 업종(공제)
+
+
+class IndustryMatch(NamedTuple):
+    industry: IndustryCode
+    synonym: str  # 입력에서 찾은 동의어
+
+
+def normalize_industry(text: str) -> str:
+    """소문자화 후 공백·괄호·쉼표 등 기호 제거."""
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
+
+class IndustryIndex:
+    """동의어 → 업종 코드 Aho-Corasick 색인."""
+
+    def __init__(self, entries: Iterable[Tuple[str, str, int, List[str]]]):
+        self.codes: Dict[str, IndustryCode] = {}
+        self._patterns: List[Tuple[str, IndustryCode]] = []
+        # 트라이: 노드 번호 → {문자: 다음 노드}, 실패 링크, 출력(패턴 번호 목록)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._cache: Dict[str, Optional[IndustryMatch]] = {}
+        for code, name, cls, synonyms in entries:
+            ic = IndustryCode(code, name, int(cls))
+            self.codes[code] = ic
+            for syn in [name, *synonyms]:
+                self._add_pattern(normalize_industry(syn), ic)
+        self._build_fail_links()
+
+    def _add_pattern(self, pattern: str, ic: IndustryCode):
+        if not pattern:
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        if not self._out[node]:  # 같은 동의어가 여러 코드에 있으면 먼저 등록된 코드 사용
+            self._patterns.append((pattern, ic))
+            self._out[node].append(len(self._patterns) - 1)
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def get(self, code: str) -> Optional[IndustryCode]:
+        return self.codes.get(code)
+
+    def matches(self, text: str) -> List[IndustryMatch]:
+        """입력에 포함된 모든 동의어 일치 (등장 순서)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        found: List[int] = []
+        for ch in normalize_industry(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.extend(out[node])
+        return [IndustryMatch(self._patterns[i][1], self._patterns[i][0]) for i in found]
+
+    def resolve(self, text: str) -> Optional[IndustryMatch]:
+        """가장 적합한 업종 1개. 공제 분류 2 우선, 그다음 긴 동의어."""
+        if text in self._cache:
+            return self._cache[text]
+        best: Optional[IndustryMatch] = None
+        for m in self.matches(text):
+            if best is None or (m.industry.deduction_class, len(m.synonym)) > (best.industry.deduction_class,
+                                                                             len(best.synonym)):
+                best = m
+        if len(self._cache) >= RESOLVE_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[text] = best
+        return best
+
+    def is_deductible(self, text: str) -> bool:
+        """차량을 직접 사용하는 업종(분류 2)이면 True."""
+        m = self.resolve(text)
+        return m is not None and m.industry.deduction_class == 2
+
+
+def load_industry_csv(path: str) -> List[Tuple[str, str, int, List[str]]]:
+    """표준산업분류 CSV(code,name,class,synonyms) 읽기. synonyms 는 '|' 로 구분."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return [(row["code"], row["name"], int(row.get("class") or 1),
+                 [s for s in (row.get("synonyms") or "").split("|") if s])
+                for row in csv.DictReader(f)]
+
+
+def build_industry_index(extra_csv: Optional[str] = None) -> IndustryIndex:
+    """내장 표 (+ 선택적으로 CSV 로 읽은 전체 분류표) 로 색인 생성."""
+    entries = list(BUILTIN_INDUSTRIES)
+    if extra_csv:
+        entries += load_industry_csv(extra_csv)
+    return IndustryIndex(entries)
+
+
+@lru_cache(maxsize=1)
+def default_industry_index() -> IndustryIndex:
+    """프로세스 공용 색인 (처음 호출 시 1회 생성)."""
+    return build_industry_index(os.getenv("INDUSTRY_CODES_CSV"))
+
+
+def industry_class(text: str) -> int:
+    """업종 문자열 → 공제 분류 (찾지 못하면 1=일반)."""
+    m = default_industry_index().resolve(text)
+    return m.industry.deduction_class if m else 1
+
+
+def is_deductible_industry(text: str) -> bool:
+    """차량을 직접 사용하는 업종(택시/자동차학원/자동차임대업 등)인지 여부."""
+    return default_industry_index().is_deductible(text)
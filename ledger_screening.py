@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+매입장 차량 관련 매입세액 공제/불공제 선별 (스트리밍)
+---------------------------------
+- 매입장(카드 명세, 세금계산서) CSV 를 청크 단위로 읽어 차량등록부와 차량번호로 결합
+- 등록부 차량은 한 번씩만 기존 규칙(decision_table: 내장 차종 표 → 규칙 기반 판정)으로 분류
+- 차량별 × 과세기간(상반기/하반기)별로 공제/불공제/확인필요 매입세액을 집계
+- 메모리는 (차량 수 × 과세기간 수)에만 비례 → 1천만 행 매입장도 일정한 메모리로 처리
+- 거래일자·매입세액을 해석할 수 없는 행은 건너뛰고 오류 건수로 집계 (빈 줄은 무시)
+- 등록부: 차량번호 없는 행은 건너뜀, 중복 차량번호는 경고 후 처음 행 사용, 차종이 빈 차량은 확인필요
+- 진행 상황과 처리 속도(행/s)를 표준오류로 출력
+
+실행 예:
+  python ledger_screening.py ledger.csv registry.csv -o summary.csv --industry 음식점
+"""
+
+import argparse
+import csv
+import re
+import sys
+import time
+from itertools import islice
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from decision_table import DecisionTable, Verdict, build_decision_table, make_keys
+
+UNREGISTERED = "미등록"
+BUCKETS = ["공제", "불공제", "확인필요"]
+MISSING_NAME = Verdict(None, "차종 미기재", "registry")  # 규칙 판정 없이 확인필요
+
+# 연도 4자리 + 월 1~2자리 (구분자 '-', '.', '/', '년', 공백 또는 없음). 시각이 붙어 있어도 무시
+DATE_PAT = re.compile(r"\s*(\d{4})[-./년\s]*(\d{1,2})")
+
+
+class RegisteredVehicle(NamedTuple):
+    name: str
+    verdict: Verdict
+    bucket: int  # BUCKETS 인덱스
+
+
+# 집계 값: [건수, 공제 매입세액, 불공제 매입세액, 확인필요 매입세액] (원 단위 정수)
+Totals = List[int]
+
+
+# ---------------------------------------------
+# 유틸
+# ---------------------------------------------
+def period_of(date_text: str) -> Optional[str]:
+    """'2025-03-14' / '20250314' / '2025.3.14' / '2025-03-14 10:23:11' → '2025 상반기'.
+    해석할 수 없으면 None.
+    """
+    m = DATE_PAT.match(date_text)
+    if m is None:
+        return None
+    month = int(m.group(2))
+    if not 1 <= month <= 12:
+        return None
+    return f"{m.group(1)} {'상반기' if month <= 6 else '하반기'}"
+
+
+def parse_won(text: str) -> Optional[int]:
+    """'1,234' / '1234.0' 같은 금액 문자열 → 원 단위 정수. 빈 칸은 0, 해석할 수 없으면 None."""
+    text = text.replace(",", "").strip()
+    if not text:
+        return 0
+    try:
+        return int(round(float(text))) if "." in text else int(text)
+    except ValueError:
+        return None
+
+
+def bucket_of(verdict: Optional[Verdict]) -> int:
+    """판정 결과 → BUCKETS 인덱스 (미등록·좌석수 미상은 확인필요)."""
+    if verdict is None or verdict.deductible is None:
+        return 2
+    return 0 if verdict.deductible else 1
+
+
+def load_registry(path: str, id_column: str, name_column: str, industry_column: Optional[str],
+                  default_industry: str, table: DecisionTable) -> Dict[str, RegisteredVehicle]:
+    """차량등록부 → 차량번호별 차종명과 판정 결과 (차량당 1회 분류).
+    필요한 열이 없으면 ValueError. 차량번호가 빈 행은 건너뛰고, 같은 차량번호는 처음 행을 쓰고 경고.
+    """
+    entries: List[Tuple[str, str, str]] = []  # (차량번호, 차종, 업종)
+    malformed = 0
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        header = reader.fieldnames or []
+        missing = [c for c in (id_column, name_column, industry_column) if c and c not in header]
+        if missing:
+            raise ValueError(f"차량등록부에 없는 열: {', '.join(missing)} (등록부 열: {', '.join(header) or '없음'})")
+        for row in reader:
+            # 열이 모자란 행은 값이 None
+            vehicle_id = (row.get(id_column) or "").strip()
+            if not vehicle_id:
+                malformed += 1
+                continue
+            industry = (row.get(industry_column) if industry_column else "") or default_industry
+            entries.append((vehicle_id, (row.get(name_column) or "").strip(), industry))
+
+    # 차종이 있는 행만 한 번에 판정 (빈 차종을 규칙에 넘기면 불공제로 분류되므로 제외)
+    named = [(name, industry) for _, name, industry in entries if name]
+    names = [name for name, _ in named]
+    verdicts = iter(table.lookup_many(make_keys([industry for _, industry in named], names), names))
+    registry: Dict[str, RegisteredVehicle] = {}
+    duplicates: List[str] = []
+    for vehicle_id, name, _ in entries:
+        verdict = next(verdicts) if name else MISSING_NAME
+        if vehicle_id in registry:
+            duplicates.append(vehicle_id)
+            continue
+        registry[vehicle_id] = RegisteredVehicle(name, verdict, bucket_of(verdict))
+
+    if malformed:
+        print(f"등록부: 차량번호 없는 행 {malformed:,}건 건너뜀", file=sys.stderr)
+    if duplicates:
+        print(f"경고: 등록부 중복 차량번호 {len(duplicates):,}건 – 처음 행 기준 "
+              f"(예: {', '.join(duplicates[:5])})", file=sys.stderr)
+    return registry
+
+
+def chunked_rows(reader: Iterator[List[str]], size: int) -> Iterator[List[List[str]]]:
+    while True:
+        chunk = list(islice(reader, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ---------------------------------------------
+# 파이프라인
+# ---------------------------------------------
+def screen_ledger(ledger_path: str, registry: Dict[str, RegisteredVehicle], date_column: str,
+                  vehicle_column: str, tax_column: str, chunk_size: int = 100_000,
+                  progress_every: int = 1_000_000
+                  ) -> Tuple[Dict[Tuple[str, str], Totals], Dict[str, Totals], int, int]:
+    """매입장을 스트리밍으로 선별·집계.
+    return ((차량번호, 과세기간) 합계, 과세기간 합계, 차량번호 없는 행 수, 오류 행 수)
+    오류 행: 열이 모자라거나 거래일자·매입세액을 해석할 수 없는 행 (집계에서 제외)
+    """
+    by_vehicle: Dict[Tuple[str, str], Totals] = {}
+    by_period: Dict[str, Totals] = {}
+    unregistered_bucket = bucket_of(None)
+    skipped = 0
+    errors = 0
+    processed = 0
+    next_report = progress_every
+    start = time.perf_counter()
+
+    with open(ledger_path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        i_date, i_vehicle, i_tax = (header.index(c) for c in (date_column, vehicle_column, tax_column))
+        width = max(i_date, i_vehicle, i_tax) + 1
+
+        for chunk in chunked_rows(reader, chunk_size):
+            for row in chunk:
+                if len(row) < width:
+                    if any(cell.strip() for cell in row):
+                        errors += 1
+                    continue  # 빈 줄은 무시
+                vehicle_id = row[i_vehicle].strip()
+                if not vehicle_id:
+                    skipped += 1  # 차량과 무관한 매입
+                    continue
+                reg = registry.get(vehicle_id)
+                if reg is None:
+                    vehicle_id, bucket = UNREGISTERED, unregistered_bucket
+                else:
+                    bucket = reg.bucket
+                period = period_of(row[i_date])
+                tax = parse_won(row[i_tax])
+                if period is None or tax is None:
+                    errors += 1
+                    continue
+
+                totals = by_vehicle.get((vehicle_id, period))
+                if totals is None:
+                    totals = by_vehicle[(vehicle_id, period)] = [0, 0, 0, 0]
+                totals[0] += 1
+                totals[1 + bucket] += tax
+                totals = by_period.get(period)
+                if totals is None:
+                    totals = by_period[period] = [0, 0, 0, 0]
+                totals[0] += 1
+                totals[1 + bucket] += tax
+
+            processed += len(chunk)
+            if processed >= next_report:
+                elapsed = time.perf_counter() - start
+                print(f"  {processed:,}행 처리 ({processed / elapsed:,.0f}행/s)", file=sys.stderr)
+                next_report += progress_every
+
+    elapsed = time.perf_counter() - start
+    print(f"완료: {processed:,}행, {elapsed:.1f}s ({processed / elapsed if elapsed else 0:,.0f}행/s), "
+          f"차량 무관 {skipped:,}행, 오류 {errors:,}행", file=sys.stderr)
+    return by_vehicle, by_period, skipped, errors
+
+
+def write_summary(f, by_vehicle: Dict[Tuple[str, str], Totals], registry: Dict[str, RegisteredVehicle]):
+    w = csv.writer(f)
+    w.writerow(["차량번호", "차종", "판정근거", "과세기간", "건수"] + [f"{b} 매입세액" for b in BUCKETS])
+    for (vehicle_id, period), t in sorted(by_vehicle.items()):
+        reg = registry.get(vehicle_id)
+        w.writerow([vehicle_id, reg.name if reg else "", reg.verdict.reason if reg else "", period] + t)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="매입장에서 차량 관련 불공제 매입세액 선별")
+    ap.add_argument("ledger", help="매입장 CSV")
+    ap.add_argument("registry", help="차량등록부 CSV")
+    ap.add_argument("-o", "--output", help="차량·과세기간별 집계 CSV (기본: 표준출력)")
+    ap.add_argument("--industry", default="", help="사업자 업종 (등록부에 업종 열이 없을 때 사용)")
+    ap.add_argument("--date-column", default="거래일자")
+    ap.add_argument("--vehicle-column", default="차량번호", help="매입장의 차량번호 열")
+    ap.add_argument("--tax-column", default="매입세액")
+    ap.add_argument("--registry-id-column", default="차량번호")
+    ap.add_argument("--registry-name-column", default="차종")
+    ap.add_argument("--registry-industry-column", help="등록부의 업종 열 (선택)")
+    ap.add_argument("--chunk-size", type=int, default=100_000)
+    ap.add_argument("--progress-every", type=int, default=1_000_000, help="진행 상황 출력 간격(행)")
+    args = ap.parse_args(argv)
+
+    try:
+        registry = load_registry(args.registry, args.registry_id_column, args.registry_name_column,
+                                 args.registry_industry_column, args.industry, build_decision_table())
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+    by_vehicle, by_period, _, _ = screen_ledger(args.ledger, registry, args.date_column, args.vehicle_column,
+                                                args.tax_column, max(1, args.chunk_size),
+                                                max(1, args.progress_every))
+
+    for period, t in sorted(by_period.items()):
+        print(f"{period}: " + ", ".join(f"{b} {tax:,}원" for b, tax in zip(BUCKETS, t[1:])) + f" ({t[0]:,}건)",
+              file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8-sig", newline="") as f:
+            write_summary(f, by_vehicle, registry)
+    else:
+        write_summary(sys.stdout, by_vehicle, registry)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAI Responses API 로컬 스텁 (네트워크 없이 측정·시험용)
+---------------------------------
+- client.responses.create(model=..., input=..., response_format=...) 와 같은 모양으로 호출
+- 차량유형은 vehicle_rules.ai_guess_vehicle_types 로 흉내 내고 JSON 문자열로 응답
+- 단건/묶음(vehicle_extraction_batch) 스키마 모두 지원
+- 지연시간(기본 + 출력 토큰당), 항목 누락률, 요청 실패율을 지정해 재시도 경로를 재현
+- usage.input_tokens / output_tokens 는 근사치 (ASCII 4자당 1토큰, 그 외 문자 1자당 1토큰,
+  입력에는 응답 스키마 크기 포함)
+"""
+
+import json
+import random
+import re
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from vehicle_external import SUPPORTED_TYPES
+from vehicle_rules import ai_guess_vehicle_types
+
+BATCH_LINE = re.compile(r"^(\d+): (.*)$")
+
+
+def approx_tokens(text: str) -> int:
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return max(1, ascii_chars // 4 + (len(text) - ascii_chars))
+
+
+def stub_classify(text: str) -> Dict[str, Any]:
+    tags, _scores, seats = ai_guess_vehicle_types(text)
+    vtype = next((t for t in tags if t in SUPPORTED_TYPES), "세단")
+    return {"vehicle_type": vtype, "seats": seats, "rationale": "로컬 규칙 추정: " + (", ".join(tags) or "없음")}
+
+
+class _Responses:
+    def __init__(self, owner: "StubClient"):
+        self.owner = owner
+
+    def create(self, model: str, input: List[Dict[str, str]], response_format: Dict[str, Any], **_: Any):
+        return self.owner.handle(input[-1]["content"], response_format)
+
+
+class StubClient:
+    """openai.OpenAI 대용. latency_s + output_tokens × per_token_s 만큼 대기 후 응답."""
+
+    def __init__(self, latency_s: float = 0.0, per_token_s: float = 0.0, drop_rate: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = 0):
+        self.latency_s = latency_s
+        self.per_token_s = per_token_s
+        self.drop_rate = drop_rate
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.responses = _Responses(self)
+
+    def handle(self, prompt: str, response_format: Dict[str, Any]):
+        self.calls += 1
+        if self.error_rate and self.rng.random() < self.error_rate:
+            raise RuntimeError("stub: 요청 실패")
+
+        spec = response_format["json_schema"]
+        if spec["name"].endswith("_batch"):
+            lines = prompt.split("입력 목록 (index: 문자열):\n", 1)[-1].splitlines()
+            items = []
+            for line in lines:
+                m = BATCH_LINE.match(line)
+                if not m or (self.drop_rate and self.rng.random() < self.drop_rate):
+                    continue
+                items.append({"index": int(m.group(1)), **stub_classify(m.group(2))})
+            text = json.dumps({"items": items}, ensure_ascii=False)
+        else:
+            text = json.dumps(stub_classify(prompt.rsplit("입력: ", 1)[-1]), ensure_ascii=False)
+
+        input_tokens = approx_tokens(prompt) + approx_tokens(json.dumps(spec["schema"], ensure_ascii=False))
+        output_tokens = approx_tokens(text)
+        delay = self.latency_s + output_tokens * self.per_token_s
+        if delay:
+            time.sleep(delay)
+        return SimpleNamespace(
+            output=[SimpleNamespace(content=[SimpleNamespace(text=text)])],
+            usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+        )
@@ -6,128 +6,24 @@
 1) 이 파일을 예: app.py 로 저장
 2) 터미널에서: streamlit run app.py
 3) 브라우저에서 단계별로 선택 후 결과 확인
+   (차종은 이름·초성으로 검색 → 상위 결과 중 선택)
 
-데이터는 '업종분석.xlsx', '차량분석.xlsx' 내용을 코드에 내장하여
+데이터는 '업종분석.xlsx', '차량분석.xlsx' 내용을 vehicle_catalog.py 에 내장하여
 외부 파일 없이 실행됩니다.
 """
 
 import streamlit as st
 
-# ===== 내장 데이터 =====
-INDUSTRY_CLASS = {
-    '건축업': 1,
-    '농,임 어업': 1,
-    '도소매': 1,
-    '부동산임대업': 1,
-    '서비스업': 1,
-    '운수업': 1,
-    '운수업(택시,자동차임대)': 2,
-    '음식점': 1,
-    '제조업': 1,
-}
-
-VEHICLES = {
-    'GM대우': {
-        '넥시아': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '라보': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '레이서': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '레간자': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '마티즈Ⅰ(2인승)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '마티즈Ⅱ(2인승)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '마티즈Ⅲ(2인승)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '브로엄': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스파크(2인승)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '씨에로': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '아카디아': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '에스페로': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '우라칸': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '윈스톰': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '카마로': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '칼로스': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '캐딜락': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '콜로라도(적재함 있는 화물)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '토스카': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-    },
-    '기아': {
-        'K3': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'K5': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'K7': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'K8': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'K9': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '니로EV(적재함 있는 화물)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '레이(적재함 있는 화물)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '레이(적재함 없는 승용)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '로체': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '모닝(2인승)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '모닝(4인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '봉고Ⅲ(초장축/장축/표준캡)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '세피아': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스팅어': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스포티지(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스포티지(5인~7인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스포티지(7인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스포티지(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '스포티지R(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스포티지R(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '쏘렌토(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '쏘렌토(7인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '쏘렌토(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '쎄라토': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '엑센트': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '쏘울(2인승)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '쏘울(4인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '포르테': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-    },
-    '기타': {
-        '경운기': {'공제여부': '공제가능합니다.', '설명': '농업용 작업차'},
-        '지게차': {'공제여부': '공제가능합니다.', '설명': '지게차(지게차 면허 필요)'},
-    },
-    '삼성': {
-        'QM3(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'QM3(적재함 있는 화물)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        'QM5(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'QM5(7인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'SM3': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'SM5': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        'SM7': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-    },
-    '쌍용': {
-        '뉴체어맨': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '렉스턴(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '렉스턴(7인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '렉스턴(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '무쏘(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '무쏘(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '액티언(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '액티언(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '이스타나(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '체어맨': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-    },
-    '현대': {
-        '갤로퍼': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '그레이스(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '그레이스밴(적재함 있는 화물)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '베라크루즈': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '봉고(그레이스)(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '산타모(5인~7인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '산타모(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '산타페': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스타렉스(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스타렉스(적재함 있는 화물)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '스타리아(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '스타리아(9인승)': {'공제여부': '공제가능합니다.', '설명': '8인초과 승합'},
-        '싼타페(5인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '싼타페(7인승)': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '아반떼': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '에쿠스': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '포니픽업': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '포터Ⅱ(초장축/장축/표준캡)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '포터Ⅱ(특장차,탑)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '포터Ⅱ(탑차)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-        '프라이드': {'공제여부': '공제되지 않습니다.', '설명': '개별소비세 대상차량'},
-        '헤비듀티 트럭(적재함 있는 화물)': {'공제여부': '공제가능합니다.', '설명': '적재용 화물차'},
-    },
-}
+from industry_index import industry_class
+from vehicle_catalog import INDUSTRY_CLASS, VEHICLES
+from vehicle_search import build_vehicle_search_index
+
+
+@st.cache_resource
+def get_search_index():
+    """차종 검색 인덱스 (프로세스당 1회 생성)."""
+    return build_vehicle_search_index()
+
 
 # ===== UI =====
 st.set_page_config(page_title="업종·차량 공제여부 조회", page_icon="🚗")
@@ -144,22 +40,32 @@ sel_industry = st.selectbox(
 
 # 업종이 실제로 선택되었는지 체크
 if sel_industry and sel_industry in INDUSTRY_CLASS:
-    # 내부적으로만 분류 판단
-    _cls = INDUSTRY_CLASS[sel_industry]
+    # 내부적으로만 분류 판단 (공용 업종 색인 기준)
+    _cls = industry_class(sel_industry)
 
     if _cls == 2:
         st.success("해당 업종에 직접 사용하므로 공제가능합니다.")
         st.stop()
 
-    # 분류 1인 경우에만 회사/차종 단계로 진행 (화면에는 분류 미표시)
-    companies = sorted(VEHICLES.keys())
-    sel_company = st.selectbox("회사명 선택", options=["— 회사를 선택하세요 —"] + companies, index=0)
+    # 분류 1인 경우에만 차종 검색 단계로 진행 (화면에는 분류 미표시)
+    # 전체 차종 목록 대신 검색어에 맞는 상위 K개만 선택 상자로 전달
+    query = st.text_input("차종 검색", placeholder="차종명 또는 초성 (예: 스타리아, ㅅㅌㄹ, 현대 포터)")
+    hits = get_search_index().search(query) if query.strip() else []
+
+    if query.strip() and not hits:
+        st.warning("일치하는 차종이 없습니다. 다른 이름이나 초성으로 검색해보세요.")
 
-    if sel_company and sel_company in VEHICLES:
-        models = sorted(VEHICLES[sel_company].keys())
-        sel_model = st.selectbox("차종 선택", options=["— 차종을 선택하세요 —"] + models, index=0)
+    if hits:
+        # 첫 결과를 자동 선택하지 않도록 안내 문구를 맨 앞에 둠 (선택 전에는 결과 미표시)
+        sel_hit = st.selectbox(
+            "차종 선택",
+            options=[None] + hits,
+            format_func=lambda h: "— 차종을 선택하세요 —" if h is None else h.label,
+            index=0,
+        )
 
-        if sel_model and sel_model in VEHICLES[sel_company]:
+        if sel_hit is not None:
+            sel_company, sel_model = sel_hit.company, sel_hit.model
             result = VEHICLES[sel_company][sel_model]
 
             st.markdown("---")
@@ -6,6 +6,9 @@
 - 대화형(말풍선) UI
 - 업종 질문 → (택시/자동차학원/자동차임대업) 즉시 공제
 - 차량명 → OpenAI Responses API로 '차량유형/좌석수' 구조화 추출
+  (스키마·지시문·묶음 요청은 vehicle_external.py)
+- 업종 답변에 차량명이 함께 있으면('음식점인데 스타렉스 9인승') 백그라운드에서 미리 분류,
+  차량 단계 입력이 같으면 그 결과를 바로 사용 (vehicle_prefetch.py)
 - 승합이면 좌석수 규칙 적용(>8인승 공제, ≤7인승 불가)
 - 경차/화물은 공제, 그 외(세단/SUV 등) 불가
 - 사이드바: 현재 입력값/AI 추정 결과 표시
@@ -26,11 +29,10 @@ from typing import Dict, Any
 import streamlit as st
 from openai import OpenAI
 
-# ------------------------------
-# 상수 정의
-# ------------------------------
-DEDUCTIBLE_INDUSTRIES = ["택시", "자동차학원", "자동차임대업"]
-SUPPORTED_TYPES = ["경차", "화물", "승합", "버스", "밴", "픽업", "SUV", "세단", "쿠페", "왜건", "트럭"]
+import vehicle_external as external
+from industry_index import is_deductible_industry
+from vehicle_prefetch import MAX_MENTIONS_PER_TURN, SpeculativePrefetcher, vehicle_mentions
+from vehicle_trie import build_vehicle_trie
 
 # ------------------------------
 # OpenAI 클라이언트
@@ -43,57 +45,22 @@ def get_client():
 
 
 def classify_vehicle_external(vehicle_text: str) -> Dict[str, Any]:
-    """OpenAI Responses API를 호출해 차량유형/좌석수/근거를 JSON으로 받음."""
-    client = get_client()
-
-    schema = {
-        "type": "object",
-        "properties": {
-            "vehicle_type": {
-                "type": "string",
-                "description": "차량의 대표 분류",
-                "enum": SUPPORTED_TYPES
-            },
-            "seats": {
-                "type": "integer",
-                "description": "좌석 수가 텍스트에 명시된 경우 정수, 없으면 -1",
-                "minimum": -1
-            },
-            "rationale": {
-                "type": "string",
-                "description": "판단 근거 요약 (키워드/모델명/맥락)"
-            }
-        },
-        "required": ["vehicle_type", "seats", "rationale"],
-        "additionalProperties": False
-    }
-
-    prompt = (
-        "사용자가 입력한 문자열에서 차량의 유형과 좌석수를 추출하세요.\n"
-        "차량 유형은 다음 중 하나로만 답하세요: " + ", ".join(SUPPORTED_TYPES) + "\n"
-        "좌석수가 언급되지 않으면 seats는 -1.\n"
-        "예시 입력: '스타렉스 9인승' → vehicle_type='승합', seats=9\n"
-        f"입력: {vehicle_text}"
-    )
-
-    try:
-        resp = client.responses.create(
-            model="gpt-5",
-            input=[{"role": "user", "content": prompt}],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "vehicle_extraction",
-                    "schema": schema,
-                    "strict": True,
-                },
-            },
-        )
-        data = resp.output[0].content[0].text  # JSON 문자열
-        import json
-        return json.loads(data)
-    except Exception as e:
-        return {"vehicle_type": "세단", "seats": -1, "rationale": f"API 오류: {e}"}
+    """OpenAI Responses API를 호출해 차량유형/좌석수/근거를 JSON으로 받음 (vehicle_external.py)."""
+    return external.classify_vehicle_external(vehicle_text, get_client())
+
+
+@st.cache_resource
+def get_vehicle_trie():
+    return build_vehicle_trie()
+
+
+def get_prefetcher() -> SpeculativePrefetcher:
+    """세션별 선행 분류기. 작업 스레드에서는 st.* 를 쓸 수 없으므로 클라이언트를 미리 만들어 넘김."""
+    if "prefetcher" not in st.session_state:
+        client = get_client()
+        st.session_state.prefetcher = SpeculativePrefetcher(
+            lambda text: external.classify_vehicle_external(text, client))
+    return st.session_state.prefetcher
 
 
 # ------------------------------
@@ -127,6 +94,8 @@ with st.sidebar:
         st.write("**AI 추정 결과:**")
         st.json(st.session_state.ai_result, expanded=False)
     if st.button("🔄 대화 초기화"):
+        if "prefetcher" in st.session_state:
+            st.session_state.prefetcher.shutdown()
         st.session_state.clear()
         st.rerun()
 
@@ -163,11 +132,19 @@ if prompt := st.chat_input("메시지를 입력하세요..."):
     # Step 1: 업종
     if st.session_state.step == 1:
         st.session_state.industry = prompt.strip()
-        if any(k in st.session_state.industry for k in DEDUCTIBLE_INDUSTRIES):
+        if is_deductible_industry(st.session_state.industry):
             bot_say("✅ 차량 관련 비용 부가가치세 매입공제 **공제가능합니다.**\n\n(택시·자동차학원·자동차임대업 등은 차량을 직접 사용하므로 공제대상입니다.)")
             st.session_state.step = 999
         else:
-            bot_say("알겠습니다. 업종에 따라 직접 공제는 불가하네요.\n이제 **차량명**을 알려주세요. (예: 소나타, 스타렉스 9인승, 봉고 화물 등)")
+            # 업종 답변에 차량명이 섞여 있으면 차량 단계 전에 미리 분류 시작
+            mentions = vehicle_mentions(prompt, get_vehicle_trie())[:MAX_MENTIONS_PER_TURN]
+            for m in mentions:
+                get_prefetcher().submit(m)
+            if mentions:
+                example = f"앞서 말씀하신 **{mentions[0]}** 이(가) 맞다면 그대로 입력해주세요."
+            else:
+                example = "(예: 소나타, 스타렉스 9인승, 봉고 화물 등)"
+            bot_say(f"알겠습니다. 업종에 따라 직접 공제는 불가하네요.\n이제 **차량명**을 알려주세요. {example}")
             st.session_state.step = 2
 
     # Step 2: 차량 → 외부 API 분류
@@ -175,7 +152,12 @@ if prompt := st.chat_input("메시지를 입력하세요..."):
         st.session_state.vehicle = prompt.strip()
         with st.chat_message("assistant"):
             st.markdown("🔎 차량 정보를 분석 중입니다… (OpenAI)")
-        ai = classify_vehicle_external(st.session_state.vehicle)
+        # 선행 분류 결과가 있으면 재사용 (진행 중이면 완료까지 대기), 나머지는 취소
+        ai = None
+        if "prefetcher" in st.session_state:
+            ai = st.session_state.prefetcher.take(st.session_state.vehicle)
+        if ai is None:
+            ai = classify_vehicle_external(st.session_state.vehicle)
         st.session_state.ai_result = ai
 
         vtype = ai.get("vehicle_type", "세단")
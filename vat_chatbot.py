@@ -8,17 +8,14 @@
 
 import streamlit as st
 
+from industry_index import is_deductible_industry  # 공제 가능한 업종 (공용 업종 색인)
+
 # ---------------------------------------------
 # 차량 분류 정보 (간단 버전)
 # ---------------------------------------------
 TAX_FREE_TYPES = ["경차", "화물", "8인승 초과", "9인승", "승합"]
 # 차량 이름에 위 단어가 포함되어 있으면 개별소비세 비과세로 간주
 
-# ---------------------------------------------
-# 공제 가능한 업종
-# ---------------------------------------------
-DEDUCTIBLE_INDUSTRIES = ["택시", "자동차학원", "자동차임대업"]
-
 # ---------------------------------------------
 # Streamlit UI
 # ---------------------------------------------
@@ -31,7 +28,7 @@ industry = st.text_input("먼저, 업종을 입력해주세요 (예: 음식점,
 
 if industry:
     # 2️⃣ 특정 업종 공제 가능
-    if any(word in industry for word in DEDUCTIBLE_INDUSTRIES):
+    if is_deductible_industry(industry):
         st.success("✅ 차량 관련 비용 부가가치세 매입공제 **공제가능합니다.**")
         st.stop()
     else:
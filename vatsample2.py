@@ -1,28 +1,19 @@
 # app.py
 import streamlit as st
-import math
 import pandas as pd
 
+from won_math import (DEPRECIATION_RATE_BP, calc_elapsed, depreciation_schedule_won, depreciation_won,
+                      period_to_index)
+
 st.set_page_config(page_title="폐업 시 고정자산 잔존가치 계산기", layout="centered")
 
 st.title("폐업 시 고정자산 잔존가치 계산기 (부가가치세법 가정)")
 st.caption("초보자용 · Streamlit 데모 | 경과 과세기간: 구입 과세기간과 폐업 과세기간을 포함(기본)하여 계산")
 
 # -----------------------------
-# 유틸 함수
+# 유틸 함수 (과세기간 계산은 won_math.py)
 # -----------------------------
-def period_to_index(year: int, half: str) -> int:
-    """상반기=0, 하반기=1 로 하여 연-반기를 단일 인덱스로 변환"""
-    half_idx = 0 if half == "상반기" else 1
-    return year * 2 + half_idx
-
-def calc_elapsed(purchase_idx: int, close_idx: int, include_purchase: bool = True) -> int:
-    if close_idx < purchase_idx:
-        raise ValueError("폐업 과세기간이 구입 과세기간보다 앞설 수 없습니다.")
-    base = close_idx - purchase_idx
-    return base + (1 if include_purchase else 0)
-
-def format_currency(v: float) -> str:
+def format_currency(v: int) -> str:
     return f"{v:,.0f}"
 
 # -----------------------------
@@ -54,9 +45,9 @@ asset_type = st.radio(
 )
 price = st.number_input("매입가액(원)", min_value=0.0, step=1000.0, format="%.0f")
 
-# 자산별 감가율
-rate = 0.05 if asset_type.startswith("1.") else 0.25
-rate_label = "5%" if rate == 0.05 else "25%"
+# 자산별 감가율 (정수 bp, 5% = 500bp)
+rate_bp = DEPRECIATION_RATE_BP["building"] if asset_type.startswith("1.") else DEPRECIATION_RATE_BP["other"]
+rate_label = f"{rate_bp / 100:g}%"
 
 # -----------------------------
 # 계산
@@ -67,12 +58,9 @@ if st.button("계산하기", type="primary"):
         c_idx = period_to_index(close_year, close_half)
         elapsed = calc_elapsed(p_idx, c_idx, include_purchase=include_purchase)
 
-        # 이론상 최대 차감 가능한 과세기간(정액, 원금의 100% 한도)
-        max_periods = math.ceil(1.0 / rate)  # 5%->20, 25%->4
-        used_periods = min(elapsed, max_periods)
-
-        total_depr = price * rate * used_periods
-        residual = max(0.0, price - total_depr)
+        # 원 단위 정수 계산 (원 미만 버림, 원금의 100% 한도) – won_math.py 참고
+        price_won = int(price)
+        total_depr, residual = depreciation_won(price_won, rate_bp, elapsed)
 
         # 결과 표시
         st.success("계산 완료")
@@ -87,22 +75,8 @@ if st.button("계산하기", type="primary"):
             st.metric("잔존가액(원)", value=format_currency(residual))
 
         with st.expander("상세 보기 (기간별 누적 감가상각 표)"):
-            rows = []
-            remaining = price
-            for i in range(1, elapsed + 1):
-                # 정액: 매 기간 감가액 = price * rate, 다만 잔액이 부족하면 0까지
-                depreciation = min(remaining, price * rate)
-                remaining = max(0.0, remaining - depreciation)
-                rows.append({
-                    "회차(과세기간)": i,
-                    "당기 감가상각액": depreciation,
-                    "누적 감가상각액": price - remaining,
-                    "기말 잔존가액": remaining
-                })
-            df = pd.DataFrame(rows)
-            df["당기 감가상각액"] = df["당기 감가상각액"].round(0)
-            df["누적 감가상각액"] = df["누적 감가상각액"].round(0)
-            df["기말 잔존가액"] = df["기말 잔존가액"].round(0)
+            # 정액: 누적 감가액 = price × rate × 회차 (원금 한도), 당기액은 누적액 차이
+            df = pd.DataFrame(depreciation_schedule_won(price_won, rate_bp, elapsed))
             st.dataframe(df, use_container_width=True)
 
         st.info(
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+외부 API(OpenAI Responses) 차량유형 분류 – 단건 / 다건 묶음 요청
+---------------------------------
+- 단건: classify_vehicle_external() – 차량 문자열 1개당 요청 1회 (기존 챗봇 동작)
+- 묶음: classify_vehicles_batched() – 최대 N개를 한 요청에 담아 배열 스키마로 받고
+  index 로 다시 나눔. 누락·형식 오류 항목만 골라 재요청
+- JSON 스키마와 지시문 앞부분은 모듈 로드 시 한 번만 생성
+- UsageStats 로 요청 수·토큰·소요시간을 집계 (건당 비용/지연 비교용, 실패한 요청도 포함)
+
+client 는 openai.OpenAI() 또는 같은 responses.create 인터페이스를 가진 객체(openai_stub.StubClient)
+
+실행: python vehicle_external.py  (로컬 스텁 기준 단건 vs 묶음 건당 토큰·지연 비교)
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+SUPPORTED_TYPES = ["경차", "화물", "승합", "버스", "밴", "픽업", "SUV", "세단", "쿠페", "왜건", "트럭"]
+MODEL = "gpt-5"
+DEFAULT_BATCH_SIZE = 20
+
+# ------------------------------
+# 스키마 / 지시문 (1회 생성)
+# ------------------------------
+ITEM_PROPERTIES = {
+    "vehicle_type": {
+        "type": "string",
+        "description": "차량의 대표 분류",
+        "enum": SUPPORTED_TYPES
+    },
+    "seats": {
+        "type": "integer",
+        "description": "좌석 수가 텍스트에 명시된 경우 정수, 없으면 -1",
+        "minimum": -1
+    },
+    "rationale": {
+        "type": "string",
+        "description": "판단 근거 요약 (키워드/모델명/맥락)"
+    }
+}
+
+SINGLE_SCHEMA = {
+    "type": "object",
+    "properties": ITEM_PROPERTIES,
+    "required": ["vehicle_type", "seats", "rationale"],
+    "additionalProperties": False
+}
+
+BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer", "description": "입력 목록의 번호", "minimum": 0},
+                    **ITEM_PROPERTIES,
+                },
+                "required": ["index", "vehicle_type", "seats", "rationale"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["items"],
+    "additionalProperties": False
+}
+
+SINGLE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "vehicle_extraction", "schema": SINGLE_SCHEMA, "strict": True},
+}
+
+BATCH_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "vehicle_extraction_batch", "schema": BATCH_SCHEMA, "strict": True},
+}
+
+PROMPT_PREFIX = (
+    "사용자가 입력한 문자열에서 차량의 유형과 좌석수를 추출하세요.\n"
+    "차량 유형은 다음 중 하나로만 답하세요: " + ", ".join(SUPPORTED_TYPES) + "\n"
+    "좌석수가 언급되지 않으면 seats는 -1.\n"
+    "예시 입력: '스타렉스 9인승' → vehicle_type='승합', seats=9\n"
+)
+
+BATCH_PROMPT_PREFIX = (
+    PROMPT_PREFIX
+    + "아래 목록의 각 항목마다 결과를 하나씩, 같은 index 를 붙여 items 배열로 답하세요.\n"
+    "입력 목록 (index: 문자열):\n"
+)
+
+
+ERROR_PREFIX = "API 오류: "
+
+
+def error_result(e: Any) -> Dict[str, Any]:
+    return {"vehicle_type": "세단", "seats": -1, "rationale": f"{ERROR_PREFIX}{e}"}
+
+
+def is_error_result(result: Dict[str, Any]) -> bool:
+    """error_result 로 만든 대체 결과인지 (호출 측에서 다시 요청할지 판단용)."""
+    return str(result.get("rationale", "")).startswith(ERROR_PREFIX)
+
+
+class UsageStats:
+    """요청 수·토큰·소요시간 누적 (응답에 usage 가 있으면 사용). 실패한 요청도 요청 수·시간에 포함."""
+
+    def __init__(self):
+        self.requests = 0
+        self.failed_requests = 0
+        self.items = 0
+        self.retried_items = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.seconds = 0.0
+
+    def record(self, resp: Any, n_items: int, seconds: float, failed: bool = False):
+        self.requests += 1
+        if failed:
+            self.failed_requests += 1
+        self.items += n_items
+        self.seconds += seconds
+        usage = getattr(resp, "usage", None)
+        if usage is not None:
+            self.input_tokens += getattr(usage, "input_tokens", 0) or 0
+            self.output_tokens += getattr(usage, "output_tokens", 0) or 0
+
+    def per_item(self, n: int) -> Dict[str, float]:
+        n = max(n, 1)
+        return {
+            "requests": self.requests / n,
+            "input_tokens": self.input_tokens / n,
+            "output_tokens": self.output_tokens / n,
+            "latency_ms": self.seconds * 1000 / n,
+        }
+
+
+def _create(client, prompt: str, fmt: Dict[str, Any], n_items: int, stats: Optional[UsageStats]) -> str:
+    t0 = time.perf_counter()
+    try:
+        resp = client.responses.create(
+            model=MODEL,
+            input=[{"role": "user", "content": prompt}],
+            response_format=fmt,
+        )
+    except Exception:
+        # 실패한 왕복도 비용·지연에 포함
+        if stats is not None:
+            stats.record(None, n_items, time.perf_counter() - t0, failed=True)
+        raise
+    if stats is not None:
+        stats.record(resp, n_items, time.perf_counter() - t0)
+    return resp.output[0].content[0].text  # JSON 문자열
+
+
+def _valid(item: Any) -> bool:
+    return (isinstance(item, dict)
+            and item.get("vehicle_type") in SUPPORTED_TYPES
+            and isinstance(item.get("seats"), int) and item["seats"] >= -1
+            and isinstance(item.get("rationale"), str))
+
+
+# ------------------------------
+# 단건
+# ------------------------------
+def classify_vehicle_external(vehicle_text: str, client, stats: Optional[UsageStats] = None) -> Dict[str, Any]:
+    """OpenAI Responses API를 호출해 차량유형/좌석수/근거를 JSON으로 받음."""
+    try:
+        data = _create(client, PROMPT_PREFIX + f"입력: {vehicle_text}", SINGLE_FORMAT, 1, stats)
+        return json.loads(data)
+    except Exception as e:
+        return error_result(e)
+
+
+# ------------------------------
+# 묶음
+# ------------------------------
+def classify_vehicles_batched(vehicle_texts: List[str], client, batch_size: int = DEFAULT_BATCH_SIZE,
+                              max_retries: int = 1, stats: Optional[UsageStats] = None) -> List[Dict[str, Any]]:
+    """여러 차량 문자열을 batch_size 개씩 묶어 요청. 결과는 입력 순서와 같음.
+    응답에서 빠졌거나 형식이 틀린 항목만 최대 max_retries 번 다시 묶어 요청하고,
+    끝내 실패한 항목은 단건 호출과 같은 오류 결과로 채운다.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size 는 1 이상이어야 합니다: {batch_size}")
+    results: List[Optional[Dict[str, Any]]] = [None] * len(vehicle_texts)
+    pending = list(range(len(vehicle_texts)))
+    last_error: Any = "응답 누락"
+
+    for attempt in range(max_retries + 1):
+        failed: List[int] = []
+        for start in range(0, len(pending), batch_size):
+            group = pending[start:start + batch_size]
+            # 요청 안에서는 0..n-1 로 번호를 다시 매김
+            lines = "".join(f"{i}: {' '.join(vehicle_texts[g].split())}\n" for i, g in enumerate(group))
+            try:
+                data = json.loads(_create(client, BATCH_PROMPT_PREFIX + lines, BATCH_FORMAT, len(group), stats))
+                items = data.get("items", []) if isinstance(data, dict) else []
+            except Exception as e:
+                last_error = e
+                items = []
+            got: Dict[int, Dict[str, Any]] = {}
+            for item in items:
+                idx = item.get("index") if isinstance(item, dict) else None
+                if isinstance(idx, int) and 0 <= idx < len(group) and _valid(item):
+                    got[idx] = {k: item[k] for k in ("vehicle_type", "seats", "rationale")}
+            for i, g in enumerate(group):
+                if i in got:
+                    results[g] = got[i]
+                else:
+                    failed.append(g)
+        if not failed:
+            break
+        if stats is not None and attempt < max_retries:
+            stats.retried_items += len(failed)
+        pending = failed
+
+    return [r if r is not None else error_result(last_error) for r in results]
+
+
+if __name__ == "__main__":
+    from openai_stub import StubClient
+
+    ap = argparse.ArgumentParser(description="단건 vs 묶음 요청 건당 비용/지연 비교 (로컬 스텁)")
+    ap.add_argument("-n", type=int, default=200, help="차량 문자열 수")
+    ap.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    ap.add_argument("--latency-ms", type=float, default=30.0, help="스텁 요청당 기본 지연")
+    ap.add_argument("--per-token-ms", type=float, default=0.2, help="스텁 출력 토큰당 지연")
+    ap.add_argument("--drop-rate", type=float, default=0.02, help="묶음 응답에서 항목이 빠질 확률")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="스텁 요청 실패 확률")
+    args = ap.parse_args()
+
+    samples = ["스타렉스 9인승", "봉고 화물", "소나타", "카니발 11인승", "모닝", "포터2 탑차", "그랜저", "투싼"]
+    texts = [samples[i % len(samples)] + f" {i}호차" for i in range(args.n)]
+
+    def make_client():
+        return StubClient(latency_s=args.latency_ms / 1000, per_token_s=args.per_token_ms / 1000,
+                          drop_rate=args.drop_rate, error_rate=args.error_rate, seed=0)
+
+    single = UsageStats()
+    client = make_client()
+    for t in texts:
+        classify_vehicle_external(t, client, stats=single)
+
+    batched = UsageStats()
+    batched_results = classify_vehicles_batched(texts, make_client(), batch_size=args.batch_size, stats=batched)
+    failed = sum(1 for r in batched_results if r["rationale"].startswith("API 오류"))
+
+    print(f"{args.n}건, 묶음 크기 {args.batch_size}")
+    print(f"{'':8}{'요청/건':>10}{'입력토큰/건':>14}{'출력토큰/건':>14}{'지연ms/건':>12}")
+    for label, st in (("단건", single), ("묶음", batched)):
+        p = st.per_item(args.n)
+        print(f"{label:8}{p['requests']:>10.3f}{p['input_tokens']:>14.1f}{p['output_tokens']:>14.1f}"
+              f"{p['latency_ms']:>12.2f}")
+    print(f"실패 요청: 단건 {single.failed_requests}회, 묶음 {batched.failed_requests}회")
+    print(f"묶음 재요청 항목 {batched.retried_items}건, 최종 실패 {failed}건")
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+차량 분류 선행 요청 (업종 단계에서 미리 외부 API 호출)
+---------------------------------
+- vehicle_mentions(): 앞선 대화에서 차량으로 보이는 구간 추출
+  예) "음식점인데 스타렉스 9인승" → ["스타렉스 9인승"]
+  (좌석수 패턴, 또는 키워드/모델명/내장 차종명(괄호 앞 기본 이름, 회사명 포함 별칭)과 통째로 같은
+   어절이 연속된 구간. '굿모닝'·'밴드'처럼 이름을 포함만 하거나 '산타'·'스타'처럼 이름의 앞부분인
+   어절은 제외 – 차량 단계 답변과 일치할 수 없어 낭비 요청만 됨. 조사가 붙은 어절에서 구간을 끊음)
+- SpeculativePrefetcher: 세션별 백그라운드 스레드에서 분류를 시작해 두고,
+  차량 단계 입력이 같은 문자열(공백·기호·대소문자 무시)이면 그 결과를 그대로 사용
+- 쓰이지 않은 요청은 취소(아직 시작 전인 것만 실제 취소)하고 낭비 건수로 집계,
+  세션당 낭비가 max_wasted 에 이르면 더 이상 선행 요청하지 않음
+- 선행 요청이 API 오류 결과(is_error)를 냈거나 take_timeout_s 안에 끝나지 않으면 미사용으로 보고
+  None 을 돌려줌 → 호출 측이 직접 다시 요청. 시간 초과 뒤에는 그 세션의 선행 요청을 멈춤
+
+classify 는 문자열 1개를 받아 결과 dict 를 돌려주는 함수. 작업 스레드에서 실행되므로
+streamlit 함수(st.*)를 호출하면 안 됨 – 클라이언트는 미리 만들어 넘길 것.
+"""
+
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from vehicle_external import is_error_result
+from vehicle_catalog import VEHICLES
+from vehicle_rules import KEYWORD_RULES, MODEL_LEXICON, SEAT_PAT
+from vehicle_trie import PrefixTrie
+
+MAX_MENTIONS_PER_TURN = 2  # 메시지 하나에서 선행 요청할 최대 구간 수
+MAX_WASTED = 3             # 세션당 쓰이지 않고 버려도 되는 선행 요청 수
+TAKE_TIMEOUT_S = 15.0      # 차량 단계에서 진행 중인 선행 요청을 기다리는 최대 시간
+
+TOKEN_STRIP = re.compile(r"^[^\w(]+|[^\w)]+$")
+# 어절 끝 조사/어미 ('소나타도', '렉스턴(9인승)이요') – 떼어도 차량명으로 보일 때만 제거
+PARTICLES = sorted(["입니다", "이에요", "예요", "이요", "이고", "이랑", "하고", "랑", "요", "고", "도",
+                    "를", "을", "은", "는", "이", "가"], key=len, reverse=True)
+# 모델명 뒤에 붙는 숫자·영문·괄호 ('포터2', '봉고3', '스타렉스(9인승)')
+NAME_TAIL = re.compile(r"(\d+|[a-z]+|\([^)]*\))+$")
+
+
+def normalize_mention(text: str) -> str:
+    """선행 결과 재사용 판단용 키: 공백·기호 제거, 소문자."""
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
+
+def _vehicle_names() -> Set[str]:
+    """차량으로 인정하는 전체 이름 (정규화): 키워드, 모델명, 내장 차종명과 괄호 앞 기본 이름, 회사명+이름."""
+    names = set(KEYWORD_RULES) | set(MODEL_LEXICON)
+    for company, models in VEHICLES.items():
+        for model in models:
+            stem = model.split("(")[0]
+            names.update((model, stem, company + model, company + stem))
+    return {n for n in map(normalize_mention, names) if n}
+
+
+NAMES = _vehicle_names()
+
+
+def _known_name(text: str, trie: Optional[PrefixTrie]) -> bool:
+    """이름·별칭과 통째로 같은지 (앞부분만 같은 것은 제외)."""
+    if normalize_mention(text) in NAMES:
+        return True
+    return trie is not None and trie.exact(text) is not None
+
+
+def _vehicle_like(token: str, trie: Optional[PrefixTrie]) -> bool:
+    if SEAT_PAT.search(token):
+        return True
+    lower = token.lower()
+    if _known_name(lower, trie):
+        return True
+    stem = NAME_TAIL.sub("", lower)
+    return bool(stem) and stem != lower and _known_name(stem, trie)
+
+
+def vehicle_mentions(text: str, trie: Optional[PrefixTrie] = None) -> List[str]:
+    """차량으로 보이는 어절이 연속된 구간 목록 (등장 순, 중복 제거)."""
+    mentions: List[str] = []
+    run: List[str] = []
+    def close():
+        # 좌석수만 있는 구간('9인승')은 차량명이 아니므로 제외
+        if run and not all(SEAT_PAT.fullmatch(t) for t in run):
+            mention = " ".join(run)
+            if mention not in mentions:
+                mentions.append(mention)
+        run.clear()
+
+    for raw in text.split():
+        token = TOKEN_STRIP.sub("", raw)
+        stem = next((token[:-len(p)] for p in PARTICLES
+                     if token.endswith(p) and len(token) > len(p) and _vehicle_like(token[:-len(p)], trie)), None)
+        if stem is not None:
+            # '그랜저랑 포터' → 조사에서 끊어 각각 별도 구간
+            run.append(stem)
+            close()
+        elif token and _vehicle_like(token, trie):
+            run.append(token)
+        else:
+            close()
+    close()
+    return mentions
+
+
+class SpeculativePrefetcher:
+    """세션별 선행 분류. submit() 으로 시작, take() 로 결과 회수, cancel_all() 로 정리."""
+
+    def __init__(self, classify: Callable[[str], Dict[str, Any]], max_wasted: int = MAX_WASTED,
+                 take_timeout_s: float = TAKE_TIMEOUT_S,
+                 is_error: Callable[[Dict[str, Any]], bool] = is_error_result):
+        self.classify = classify
+        self.max_wasted = max_wasted
+        self.take_timeout_s = take_timeout_s
+        self.is_error = is_error
+        self.stalled = False  # 시간 초과로 작업 스레드가 묶였으면 더 이상 제출하지 않음
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vehicle-prefetch")
+        self.futures: Dict[str, Future] = {}
+        self.submitted = 0
+        self.used = 0
+        self.wasted = 0
+
+    def submit(self, text: str) -> bool:
+        """선행 요청 시작. 이미 요청했거나 낭비 한도에 이르렀으면 False."""
+        key = normalize_mention(text)
+        if self.stalled or not key or key in self.futures or self.wasted + len(self.futures) >= self.max_wasted:
+            return False
+        self.futures[key] = self.executor.submit(self.classify, text)
+        self.submitted += 1
+        return True
+
+    def take(self, text: str) -> Optional[Dict[str, Any]]:
+        """같은 문자열의 선행 요청이 있으면 그 결과(진행 중이면 take_timeout_s 까지 대기), 없으면 None.
+        오류 결과·예외·시간 초과도 None (미사용으로 집계) → 호출 측에서 일반 경로로 다시 요청.
+        나머지 선행 요청은 모두 취소한다.
+        """
+        future = self.futures.pop(normalize_mention(text), None)
+        self.cancel_all()
+        if future is None:
+            return None
+        try:
+            result = future.result(timeout=self.take_timeout_s)
+        except FutureTimeout:
+            future.cancel()
+            self.stalled = True
+            result = None
+        except Exception:
+            result = None
+        if result is None or self.is_error(result):
+            self.wasted += 1
+            return None
+        self.used += 1
+        return result
+
+    def cancel_all(self):
+        """남은 선행 요청 취소. 이미 실행 중인 호출은 끝나도 결과를 버림."""
+        for future in self.futures.values():
+            future.cancel()
+        self.wasted += len(self.futures)
+        self.futures.clear()
+
+    def shutdown(self):
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {"submitted": self.submitted, "used": self.used, "wasted": self.wasted,
+                "pending": len(self.futures)}
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+차량유형 추정 규칙 (공용)
+---------------------------------
+vat_chatbot_chatui.py 의 "AI" 차량유형 추정(규칙·키워드·유사도 기반)을
+Streamlit 없이도 가져다 쓸 수 있도록 분리한 모듈.
+
+- KEYWORD_RULES : 키워드 → (태그, 가중치)
+- MODEL_LEXICON : 모델명 소규모 사전(유사도 매칭용)
+- ai_guess_vehicle_types() : (태그 목록, 점수표, 좌석수) 반환
+- deduction_from_guess() : 추정 결과 → 공제 여부 (챗봇 Step 2 와 같은 규칙)
+"""
+
+import re
+import difflib
+from typing import List, Tuple, Dict, Optional
+
+# ---------------------------------------------
+# 데이터 정의
+# ---------------------------------------------
+# 차량 유형 태그 표준화 키
+VEHICLE_TAGS_ORDER = ["경차", "화물", "승합", "버스", "밴", "픽업", "SUV", "세단", "쿠페", "왜건", "트럭"]
+
+# 키워드 → 태그, 가중치
+KEYWORD_RULES: Dict[str, Tuple[str, int]] = {
+    # 공제 가산 가능성 높은 분류
+    "경차": ("경차", 5),
+    "라보": ("화물", 5),
+    "봉고": ("화물", 5),
+    "포터": ("화물", 5),
+    "픽업": ("픽업", 4),
+    "트럭": ("트럭", 4),
+    "밴": ("밴", 4),
+    "카고": ("화물", 4),
+    "탑차": ("화물", 4),
+    "적재": ("화물", 3),
+    "화물": ("화물", 5),
+    # 승합/버스
+    "승합": ("승합", 6),
+    "버스": ("버스", 6),
+    "9인승": ("승합", 6),
+    "10인승": ("승합", 6),
+    "11인승": ("승합", 6),
+    "12인승": ("승합", 6),
+    "15인승": ("승합", 6),
+    # 일반 승용 추정(공제 불가 측)
+    "세단": ("세단", 3),
+    "소나타": ("세단", 5),
+    "아반떼": ("세단", 5),
+    "K3": ("세단", 5),
+    "K5": ("세단", 5),
+    "K7": ("세단", 5),
+    "그랜저": ("세단", 5),
+    "제네시스": ("세단", 4),
+    # SUV 계열(원칙적으로 승용 취급)
+    "SUV": ("SUV", 4),
+    "투싼": ("SUV", 4),
+    "스포티지": ("SUV", 4),
+    "쏘렌토": ("SUV", 4),
+    "싼타페": ("SUV", 4),
+    "캐스퍼": ("경차", 4),
+    # 승합으로 자주 쓰이는 모델명
+    "스타렉스": ("승합", 5),
+    "스타리아": ("승합", 5),
+    "카니발": ("승합", 5),
+}
+
+# 모델명 소규모 사전(유사도 매칭용)
+MODEL_LEXICON = {
+    # 승합/밴/화물 쪽
+    "봉고": "화물", "포터": "화물", "라보": "화물", "스타렉스": "승합", "스타리아": "승합", "카니발": "승합",
+    # 세단/승용
+    "소나타": "세단", "그랜저": "세단", "아반떼": "세단", "K5": "세단", "K3": "세단", "K7": "세단",
+    # SUV/크로스오버
+    "스포티지": "SUV", "쏘렌토": "SUV", "싼타페": "SUV", "투싼": "SUV",
+    # 경차
+    "캐스퍼": "경차", "모닝": "경차", "레이": "경차",
+}
+
+# 좌석 수 패턴 추출용
+SEAT_PAT = re.compile(r"(\d+)\s*인\s*승")
+
+
+def extract_seats(text: str) -> Optional[int]:
+    """텍스트에서 좌석수(예: 9인승)를 추출. 없으면 None."""
+    m = SEAT_PAT.search(text)
+    if m:
+        try:
+            return int(m.group(1))
+        except Exception:
+            return None
+    return None
+
+
+def sort_tags(scores: Dict[str, int]) -> List[str]:
+    """점수 내림차순, 동점이면 VEHICLE_TAGS_ORDER 순으로 정렬된 태그 목록."""
+    return sorted(scores, key=lambda t: (-scores[t], VEHICLE_TAGS_ORDER.index(t) if t in VEHICLE_TAGS_ORDER else 999))
+
+
+def ai_guess_vehicle_types(text: str) -> Tuple[List[str], Dict[str, int], int]:
+    """간단 규칙/유사도 기반으로 차량 유형 태그 후보를 반환.
+    return (tags_sorted, score_map, seats_detected)
+    """
+    s = text.strip()
+    s_lower = s.lower()
+
+    # 좌석수 추출 (예: 9인승)
+    seats = extract_seats(s)
+
+    scores: Dict[str, int] = {}
+
+    # 1) 키워드 규칙 매칭
+    for kw, (tag, w) in KEYWORD_RULES.items():
+        if kw.lower() in s_lower:
+            scores[tag] = scores.get(tag, 0) + w
+
+    # 2) 모델명 유사도(간단) - 가장 유사한 키 1~3개 가산
+    keys = list(MODEL_LEXICON.keys())
+    close = difflib.get_close_matches(s, keys, n=3, cutoff=0.78)
+    for k in close:
+        tag = MODEL_LEXICON[k]
+        scores[tag] = scores.get(tag, 0) + 4  # 유사도 가중치
+
+    # 3) 좌석 수가 9 이상이면 승합 가산
+    if seats is not None and seats >= 9:
+        scores["승합"] = scores.get("승합", 0) + 3
+
+    # 정렬된 태그 목록
+    tags = sort_tags(scores)
+    return tags, scores, seats if seats is not None else -1
+
+
+def deduction_from_guess(vehicle: str, tags: List[str], seats: int) -> Optional[bool]:
+    """ai_guess_vehicle_types 결과로 공제 여부 판정.
+    True=공제가능, False=공제불가, None=승합 추정이나 좌석수 미기재(추가 질문 필요)
+    """
+    if any(t in tags for t in ["경차", "화물"]):
+        return True
+    if "승합" in tags or "버스" in tags or ("9인승" in vehicle):
+        if seats >= 0:
+            return seats > 8
+        return None
+    return False
+
+
+def deduction_label(deductible: Optional[bool]) -> str:
+    """deduction_from_guess 결과를 화면/파일 출력용 문구로."""
+    if deductible is None:
+        return "좌석수 확인 필요"
+    return "공제가능" if deductible else "공제불가"
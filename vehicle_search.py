@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+차종 검색 인덱스 (초성·부분일치·정규화)
+---------------------------------
+- 회사명+차종명을 정규화(소문자, 공백·괄호·기호 제거, Ⅱ→2 등)해 미리 색인
+- 'ㅅㅌㄹ' 처럼 초성만 입력하면 초성 문자열에서, 그 외에는 정규화 문자열에서 부분일치 검색
+- 2글자 단위(bigram) 역색인으로 후보를 좁힌 뒤 확인하므로 수만 건에서도 전체 순회 없음
+- 차종명 또는 회사명이 검색어로 시작하는 항목은 앞 2글자 색인에서 먼저 찾으므로
+  '현대' 같은 넓은 검색어도 상위 K개가 모이면 바로 종료
+- 결과는 상위 K개만 반환 → 위젯에는 K개 옵션만 전달
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from hangul import chosung, is_chosung_query
+from vehicle_catalog import VEHICLES
+
+DEFAULT_TOP_K = 20
+
+# 로마 숫자 등 표기 차이 정규화
+CHAR_MAP = {"Ⅰ": "1", "Ⅱ": "2", "Ⅲ": "3", "Ⅳ": "4", "Ⅴ": "5"}
+
+
+class SearchHit(NamedTuple):
+    company: str
+    model: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.company} · {self.model}"
+
+
+def normalize_text(text: str) -> str:
+    """소문자화, 표기 통일 후 공백·괄호·기호 제거."""
+    return "".join(CHAR_MAP.get(ch, ch) for ch in text if ch.isalnum()).lower()
+
+
+def _grams(text: str) -> Iterable[str]:
+    """1글자는 그대로, 2글자 이상은 bigram 집합."""
+    if len(text) == 1:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class VehicleSearchIndex:
+    """(회사명, 차종명) 목록에 대한 초성/부분일치 검색 인덱스."""
+
+    def __init__(self, items: Iterable[Tuple[str, str]]):
+        # 짧은 이름이 먼저 오도록 정렬 → id 순서가 곧 기본 순위
+        self.hits: List[SearchHit] = sorted((SearchHit(c, m) for c, m in items),
+                                            key=lambda h: (len(h.model), h.model, h.company))
+        self.norm: List[str] = []
+        self.cho: List[str] = []
+        self._company_len: List[int] = []
+        self._norm_index: Dict[str, List[int]] = {}
+        self._cho_index: Dict[str, List[int]] = {}
+        # 회사명·차종명 앞 1~2글자 → id (접두 일치 후보)
+        self._norm_heads: Dict[str, List[int]] = {}
+        self._cho_heads: Dict[str, List[int]] = {}
+        for idx, h in enumerate(self.hits):
+            norm = normalize_text(h.company + h.model)
+            cho = chosung(norm)
+            self.norm.append(norm)
+            self.cho.append(cho)
+            company_len = len(normalize_text(h.company))
+            self._company_len.append(company_len)
+            self._add(self._norm_index, norm, idx)
+            self._add(self._cho_index, cho, idx)
+            self._add_heads(self._norm_heads, norm, company_len, idx)
+            self._add_heads(self._cho_heads, cho, company_len, idx)
+
+    @staticmethod
+    def _add(index: Dict[str, List[int]], text: str, idx: int):
+        # 1글자 질의도 처리할 수 있도록 unigram 도 함께 색인
+        for g in set(text) | set(_grams(text)):
+            index.setdefault(g, []).append(idx)
+
+    @staticmethod
+    def _add_heads(index: Dict[str, List[int]], text: str, company_len: int, idx: int):
+        for h in {text[:1], text[:2], text[company_len:company_len + 1], text[company_len:company_len + 2]}:
+            if h:
+                index.setdefault(h, []).append(idx)
+
+    def _is_prefix(self, text: str, q: str, idx: int) -> bool:
+        return text.startswith(q) or text.startswith(q, self._company_len[idx])
+
+    def __len__(self) -> int:
+        return len(self.hits)
+
+    def search(self, query: str, k: int = DEFAULT_TOP_K) -> List[SearchHit]:
+        """상위 k개 검색 결과. 차종명(또는 회사명)이 검색어로 시작하는 항목이 먼저, 그다음 짧은 이름 순."""
+        q = normalize_text(query)
+        if not q:
+            return []
+        if is_chosung_query(q):
+            index, heads, texts = self._cho_index, self._cho_heads, self.cho
+        else:
+            index, heads, texts = self._norm_index, self._norm_heads, self.norm
+
+        # 1) 접두 일치: 앞 2글자 색인만 id 순(=짧은 이름 순)으로 훑고 k개가 모이면 종료
+        #    색인 문자열은 회사명+차종명 (초성 변환도 글자 수 보존) → 회사명 길이만큼 건너뛰고도 비교
+        prefix: List[int] = []
+        for i in heads.get(q[:2], ()):
+            if self._is_prefix(texts[i], q, i):
+                prefix.append(i)
+                if len(prefix) >= k:
+                    return [self.hits[i] for i in prefix]
+
+        # 2) 나머지 부분일치: bigram 교집합을 id 순으로 훑어 남은 자리만 채움
+        #    접두 일치 항목은 1)에서 모두 찾았으므로 여기서는 제외만 하면 됨
+        postings = [index.get(g) for g in _grams(q)]
+        if not postings or any(p is None for p in postings):
+            return [self.hits[i] for i in prefix]
+        postings.sort(key=len)
+        if len(postings) == 1:
+            candidates: Iterable[int] = postings[0]
+        else:
+            candidates = sorted(set(postings[0]).intersection(*postings[1:]))
+
+        seen = set(prefix)
+        rest: List[int] = []
+        need = k - len(prefix)
+        for i in candidates:
+            if i not in seen and q in texts[i]:
+                rest.append(i)
+                if len(rest) >= need:
+                    break
+        return [self.hits[i] for i in prefix + rest]
+
+
+def build_vehicle_search_index() -> VehicleSearchIndex:
+    return VehicleSearchIndex((company, model) for company, models in VEHICLES.items() for model in models)
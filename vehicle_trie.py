@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+차량명 자동완성용 접두어 트라이
+---------------------------------
+- MODEL_LEXICON, KEYWORD_RULES, VEHICLES(내장 차종) 이름을 한 트라이에 적재
+- 키는 낱자모 시퀀스로 저장 → 음절 접두어('스타')와 입력 중간 상태('슽') 모두 일치
+- 각 노드에 상위 K개 후보를 미리 담아 두므로 조회 비용은 입력 길이에만 비례
+  (항목 수 5만 개에서도 키 입력당 1ms 미만)
+- 후보를 고르면 difflib 유사도 매칭 없이 바로 태그/좌석수를 확정
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from hangul import to_jamo
+from vehicle_catalog import VEHICLES
+from vehicle_rules import KEYWORD_RULES, MODEL_LEXICON, deduction_from_guess, extract_seats
+
+DEFAULT_TOP_K = 8
+LEXICON_WEIGHT = 4  # ai_guess_vehicle_types 의 유사도 가중치와 동일
+CATALOG_WEIGHT = 4  # 동점이면 짧은 이름(기본 모델명)이 먼저
+NON_DEDUCTIBLE_TAG = "승용"  # 모델명으로 유형을 알 수 없는 공제불가 차종 (개별소비세 대상 일반 승용)
+
+
+class Completion(NamedTuple):
+    label: str   # 화면 표시 및 입력값으로 쓰일 이름
+    tag: str     # 확정 차량유형 태그
+    source: str  # "lexicon" | "keyword" | "catalog"
+    weight: int  # 정렬 우선순위 (클수록 먼저)
+
+    def as_guess(self) -> Tuple[List[str], Dict[str, int], int]:
+        """ai_guess_vehicle_types 와 같은 (tags, scores, seats) 형태로 변환 (유사도 매칭 생략)."""
+        seats = extract_seats(self.label)
+        return [self.tag], {self.tag: self.weight}, seats if seats is not None else -1
+
+
+def normalize_key(text: str) -> str:
+    """공백·괄호·기호를 제거하고 소문자화한 뒤 낱자모로 변환."""
+    return to_jamo("".join(ch for ch in text.lower() if ch.isalnum()))
+
+
+class _Node:
+    __slots__ = ("children", "top", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[int] = []
+        self.terminal: Optional[int] = None
+
+
+class PrefixTrie:
+    """낱자모 단위 접두어 트라이. 항목은 생성 시 한 번에 적재한다."""
+
+    def __init__(self, entries: Iterable[Tuple[Completion, List[str]]], top_k: int = DEFAULT_TOP_K):
+        """entries: (Completion, 별칭 목록) 쌍. label 과 별칭 모두 키로 등록된다."""
+        self.top_k = top_k
+        self.root = _Node()
+        # 우선순위 순으로 넣으면 노드마다 앞에서부터 top_k 개만 채우면 된다
+        ranked = sorted(entries, key=lambda e: (-e[0].weight, len(e[0].label), e[0].label))
+        self.items: List[Completion] = [c for c, _ in ranked]
+        for idx, (c, aliases) in enumerate(ranked):
+            for key in {normalize_key(k) for k in [c.label, *aliases]}:
+                self._insert(key, idx)
+
+    def _insert(self, key: str, idx: int):
+        node = self.root
+        self._offer(node, idx)
+        for ch in key:
+            nxt = node.children.get(ch)
+            if nxt is None:
+                nxt = node.children[ch] = _Node()
+            node = nxt
+            self._offer(node, idx)
+        if node.terminal is None:
+            node.terminal = idx
+
+    def _offer(self, node: _Node, idx: int):
+        if len(node.top) < self.top_k and idx not in node.top:
+            node.top.append(idx)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _find(self, text: str) -> Optional[_Node]:
+        key = normalize_key(text)
+        if not key:
+            return None
+        node = self.root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def complete(self, prefix: str, k: Optional[int] = None) -> List[Completion]:
+        """접두어에 해당하는 상위 후보 목록. 빈 입력이면 빈 목록."""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        top = node.top if k is None else node.top[:k]
+        return [self.items[i] for i in top]
+
+    def exact(self, text: str) -> Optional[Completion]:
+        """입력이 어떤 후보의 이름(또는 별칭)과 정확히 같으면 그 후보."""
+        node = self._find(text)
+        if node is None or node.terminal is None:
+            return None
+        return self.items[node.terminal]
+
+
+# ---------------------------------------------
+# 차량 사전 → 트라이
+# ---------------------------------------------
+def stem_tag(model: str) -> Optional[str]:
+    """차종명이 MODEL_LEXICON/KEYWORD_RULES 이름으로 시작하면 그 태그 (긴 이름 우선)."""
+    name = model.lower()
+    tags = {k.lower(): tag for k, (tag, _w) in KEYWORD_RULES.items()}
+    tags.update((k.lower(), tag) for k, tag in MODEL_LEXICON.items())
+    for k in sorted(tags, key=len, reverse=True):
+        if name.startswith(k):
+            return tags[k]
+    return None
+
+
+def catalog_tag(model: str, info: Dict[str, str]) -> str:
+    """내장 차종의 공제여부/설명을 대화형 챗봇의 태그 체계로 변환."""
+    if info.get("공제여부") != "공제가능합니다.":
+        # 모델명으로 유형을 알면 그 태그 (단, 태그로 다시 판정해도 공제불가일 때만), 아니면 중립 표기
+        tag = stem_tag(model)
+        seats = extract_seats(model)
+        if tag and deduction_from_guess(model, [tag], seats if seats is not None else -1) is False:
+            return tag
+        return NON_DEDUCTIBLE_TAG
+    if "승합" in info.get("설명", ""):
+        return "승합"
+    return "화물"
+
+
+def vehicle_entries() -> List[Tuple[Completion, List[str]]]:
+    """MODEL_LEXICON → KEYWORD_RULES → VEHICLES 순으로, 같은 이름은 앞의 것만 사용."""
+    seen = set()
+    entries: List[Tuple[Completion, List[str]]] = []
+
+    def add(c: Completion, aliases: List[str]):
+        if c.label not in seen:
+            seen.add(c.label)
+            entries.append((c, aliases))
+
+    for name, tag in MODEL_LEXICON.items():
+        add(Completion(name, tag, "lexicon", LEXICON_WEIGHT), [])
+    for kw, (tag, w) in KEYWORD_RULES.items():
+        add(Completion(kw, tag, "keyword", w), [])
+    for company, models in VEHICLES.items():
+        for model, info in models.items():
+            # '현대 스타리아' 처럼 회사명을 붙여 입력해도 찾을 수 있도록 별칭 등록
+            add(Completion(model, catalog_tag(model, info), "catalog", CATALOG_WEIGHT), [company + model])
+    return entries
+
+
+def build_vehicle_trie(top_k: int = DEFAULT_TOP_K) -> PrefixTrie:
+    return PrefixTrie(vehicle_entries(), top_k=top_k)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+원(₩) 단위 정수 계산 – 소득세·감가상각 (건별 / NumPy 열 단위 일괄)
+---------------------------------
+- 금액은 int(원), 세율·감가율은 정수 베이시스포인트(bp, 1% = 100bp)로 표현
+- 끝수 처리 규칙을 명시: 기본은 원 미만 버림(ROUND_DOWN), 필요 시 사사오입(ROUND_HALF_UP)
+- 감가상각은 누적액을 한 번에 반올림(price × bp × 기간 / 10000) → 기간별 합계에 원 단위 오차 없음
+- 일괄 함수(*_batch)는 int64 배열 연산이며 건별 함수와 결과가 정확히 일치
+  (금액 × bp 가 int64 범위를 넘으면 잘못된 값을 내지 않고 OverflowError → 건별 함수 사용,
+   감가율 0 은 건별과 같이 ZeroDivisionError)
+- 일괄 함수는 NumPy 필요 (pip install numpy)
+- 과세기간 인덱스/경과 과세기간 계산(period_to_index, calc_elapsed)도 함께 제공
+
+실행: python won_math.py  (float 경로 대비 속도·불일치 건수 출력)
+"""
+
+import math
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+BP = 10_000  # 100% = 10000bp
+
+ROUND_DOWN = "down"        # 원 미만 버림 (국고금 끝수 처리)
+ROUND_HALF_UP = "half_up"  # 원 미만 사사오입
+
+# 소득 구간(이상) → 세율(bp), 높은 구간부터
+INCOME_TAX_BRACKETS: List[Tuple[int, int, str]] = [
+    (100_000_000, 3000, "고소득자"),
+    (50_000_000, 2000, "중간소득자"),
+    (0, 1000, "저소득자"),
+]
+
+# 자산 구분 → 과세기간당 감가율(bp)
+DEPRECIATION_RATE_BP = {
+    "building": 500,   # 건물·구축물 등 고정자산 5%
+    "other": 2500,     # 그 외 자산 25%
+}
+
+
+# ---------------------------------------------
+# 공통
+# ---------------------------------------------
+def apply_bp(amount: int, bp: int, rounding: str = ROUND_DOWN) -> int:
+    """amount × bp / 10000 을 정수 원으로 (음수가 아닌 금액 기준)."""
+    num = amount * bp
+    if rounding == ROUND_HALF_UP:
+        num += BP // 2
+    return num // BP
+
+
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def _apply_bp_array(amounts: np.ndarray, bp, rounding: str) -> np.ndarray:
+    # int64 곱셈은 넘쳐도 경고 없이 값이 바뀌므로 미리 범위 확인
+    if amounts.size:
+        largest = max(abs(int(amounts.max())), abs(int(amounts.min())))
+        bp_max = int(np.max(np.abs(bp)))
+        if bp_max and largest > (INT64_MAX - BP // 2) // bp_max:
+            raise OverflowError(f"금액 {largest:,}원 × {bp_max}bp 가 int64 범위를 넘습니다 (건별 함수 사용)")
+    num = amounts * bp
+    if rounding == ROUND_HALF_UP:
+        num += BP // 2
+    return num // BP
+
+
+def max_periods(rate_bp: int) -> int:
+    """원금 100% 까지 감가되는 과세기간 수 (5% → 20, 25% → 4)."""
+    return -(-BP // rate_bp)
+
+
+# ---------------------------------------------
+# 소득세
+# ---------------------------------------------
+def income_level(income: int) -> Tuple[str, int]:
+    """소득 → (소득 수준, 세율 bp)."""
+    for floor, bp, level in INCOME_TAX_BRACKETS:
+        if income >= floor:
+            return level, bp
+    return INCOME_TAX_BRACKETS[-1][2], INCOME_TAX_BRACKETS[-1][1]
+
+
+def income_tax_won(income: int, rounding: str = ROUND_DOWN) -> int:
+    return apply_bp(income, income_level(income)[1], rounding)
+
+
+def income_tax_batch(incomes: np.ndarray, rounding: str = ROUND_DOWN) -> np.ndarray:
+    """int64 소득 배열 → int64 세액 배열."""
+    incomes = np.asarray(incomes, dtype=np.int64)
+    bp = np.full(incomes.shape, INCOME_TAX_BRACKETS[-1][1], dtype=np.int64)
+    # 낮은 구간부터 덮어쓰면 최종적으로 해당하는 가장 높은 구간 세율이 남음
+    for floor, rate, _ in reversed(INCOME_TAX_BRACKETS[:-1]):
+        bp[incomes >= floor] = rate
+    return _apply_bp_array(incomes, bp, rounding)
+
+
+# ---------------------------------------------
+# 경과 과세기간 / 감가상각
+# ---------------------------------------------
+def period_to_index(year: int, half: str) -> int:
+    """상반기=0, 하반기=1 로 하여 연-반기를 단일 인덱스로 변환"""
+    half_idx = 0 if half == "상반기" else 1
+    return year * 2 + half_idx
+
+
+def calc_elapsed(purchase_idx: int, close_idx: int, include_purchase: bool = True) -> int:
+    if close_idx < purchase_idx:
+        raise ValueError("폐업 과세기간이 구입 과세기간보다 앞설 수 없습니다.")
+    base = close_idx - purchase_idx
+    return base + (1 if include_purchase else 0)
+
+
+def elapsed_batch(purchase_idx: np.ndarray, close_idx: np.ndarray, include_purchase: bool = True) -> np.ndarray:
+    """calc_elapsed 의 배열 버전."""
+    purchase_idx = np.asarray(purchase_idx, dtype=np.int64)
+    close_idx = np.asarray(close_idx, dtype=np.int64)
+    if np.any(close_idx < purchase_idx):
+        raise ValueError("폐업 과세기간이 구입 과세기간보다 앞설 수 없습니다.")
+    return close_idx - purchase_idx + (1 if include_purchase else 0)
+
+
+def depreciation_won(price: int, rate_bp: int, elapsed: int, rounding: str = ROUND_DOWN) -> Tuple[int, int]:
+    """(총 감가상각액, 잔존가액). 누적액을 한 번에 계산해 끝수 오차가 쌓이지 않음."""
+    used = min(elapsed, max_periods(rate_bp))
+    total = min(price, apply_bp(price, rate_bp * used, rounding))
+    return total, price - total
+
+
+def depreciation_schedule_won(price: int, rate_bp: int, elapsed: int,
+                              rounding: str = ROUND_DOWN) -> List[Dict[str, int]]:
+    """기간별 (당기 감가상각액, 누적 감가상각액, 기말 잔존가액). 당기액 = 누적액 차이."""
+    rows = []
+    prev = 0
+    for i in range(1, elapsed + 1):
+        cum = min(price, apply_bp(price, rate_bp * i, rounding))
+        rows.append({
+            "회차(과세기간)": i,
+            "당기 감가상각액": cum - prev,
+            "누적 감가상각액": cum,
+            "기말 잔존가액": price - cum,
+        })
+        prev = cum
+    return rows
+
+
+def depreciation_batch(prices: np.ndarray, rate_bp: np.ndarray, elapsed: np.ndarray,
+                       rounding: str = ROUND_DOWN) -> Tuple[np.ndarray, np.ndarray]:
+    """열 단위 (총 감가상각액, 잔존가액). rate_bp 는 스칼라 또는 배열."""
+    prices = np.asarray(prices, dtype=np.int64)
+    rate_bp = np.asarray(rate_bp, dtype=np.int64)
+    elapsed = np.asarray(elapsed, dtype=np.int64)
+    if np.any(rate_bp == 0):
+        raise ZeroDivisionError("감가율(rate_bp)이 0 입니다")  # max_periods 와 같은 방식으로 실패
+    used = np.minimum(elapsed, -(-BP // rate_bp))
+    total = np.minimum(prices, _apply_bp_array(prices, rate_bp * used, rounding))
+    return total, prices - total
+
+
+# ---------------------------------------------
+# 기존 float 경로 (비교용)
+# ---------------------------------------------
+def income_tax_float(income: float) -> float:
+    if income >= 100000000:
+        return income * 0.3
+    elif income >= 50000000:
+        return income * 0.2
+    return income * 0.1
+
+
+def depreciation_float(price: float, rate: float, elapsed: int) -> Tuple[float, float]:
+    used_periods = min(elapsed, math.ceil(1.0 / rate))
+    total_depr = price * rate * used_periods
+    return total_depr, max(0.0, price - total_depr)
+
+
+if __name__ == "__main__":
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    incomes = rng.integers(0, 300_000_000, n, dtype=np.int64)
+    prices = rng.integers(0, 2_000_000_000, n, dtype=np.int64)
+    rates = np.where(rng.random(n) < 0.5, DEPRECIATION_RATE_BP["building"], DEPRECIATION_RATE_BP["other"])
+    elapsed = rng.integers(1, 30, n, dtype=np.int64)
+
+    def timed(label, fn):
+        t0 = time.perf_counter()
+        out = fn()
+        print(f"{label:<28} {time.perf_counter() - t0:8.3f}s")
+        return out
+
+    print(f"{n:,}건")
+    tax_f = timed("소득세 float (건별)", lambda: [income_tax_float(float(x)) for x in incomes.tolist()])
+    tax_i = timed("소득세 int64 (일괄)", lambda: income_tax_batch(incomes))
+    dep_f = timed("감가상각 float (건별)", lambda: [depreciation_float(float(p), r / BP, e) for p, r, e
+                                               in zip(prices.tolist(), rates.tolist(), elapsed.tolist())])
+    dep_i = timed("감가상각 int64 (일괄)", lambda: depreciation_batch(prices, rates, elapsed))
+
+    # 건별 정수 결과와 일괄 결과가 정확히 같은지 (표본)
+    sample = rng.choice(n, 10_000, replace=False)
+    assert all(income_tax_won(int(incomes[i])) == tax_i[i] for i in sample)
+    assert all(depreciation_won(int(prices[i]), int(rates[i]), int(elapsed[i]))[0] == dep_i[0][i] for i in sample)
+
+    # float 결과를 화면처럼 반올림(:,.0f)했을 때 정수 사사오입 결과와 원 단위로 달라지는 건수
+    tax_diff = np.count_nonzero(np.array([round(x) for x in tax_f], dtype=np.int64)
+                                != income_tax_batch(incomes, ROUND_HALF_UP))
+    res_diff = np.count_nonzero(np.array([round(r) for _, r in dep_f], dtype=np.int64)
+                                != depreciation_batch(prices, rates, elapsed, ROUND_HALF_UP)[1])
+    print(f"float 대비 원 단위 불일치: 소득세 {tax_diff:,}건, 잔존가액 {res_diff:,}건")